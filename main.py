@@ -6,341 +6,481 @@ Assessment Year: 2026-27 (Financial Year: 2025-26)
 Run this file to compare tax under Old vs New Tax Regime.
 """
 
-from tax_calculator import compare_regimes, TaxBreakdown, LIMITS
-import variables as v
+import os
+import sys
+from functools import lru_cache
+from types import ModuleType
+from typing import TYPE_CHECKING, Optional
 
-
-# ANSI Color codes for terminal
-class Colors:
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
-    END = '\033[0m'
+if TYPE_CHECKING:
+    from tax_calculator import TaxBreakdown
 
 
+# ANSI Color codes for terminal
+CYAN = '\033[96m'
+GREEN = '\033[92m'
+YELLOW = '\033[93m'
+RED = '\033[91m'
+BOLD = '\033[1m'
+UNDERLINE = '\033[4m'
+END = '\033[0m'
+
+# Combined SGR sequences, so each styled span emits a single escape
+BOLD_HEADER = '\033[1;95m'
+BOLD_CYAN = '\033[1;96m'
+BOLD_GREEN = '\033[1;92m'
+
+# Disable colors when output is piped/redirected or NO_COLOR is set
+if not sys.stdout.isatty() or os.environ.get('NO_COLOR'):
+    CYAN = GREEN = YELLOW = RED = BOLD = UNDERLINE = END = ''
+    BOLD_HEADER = BOLD_CYAN = BOLD_GREEN = ''
+
+# Box-drawing rules used throughout the report
+_BAR_EQ_70 = '═' * 70
+_BAR_DASH_68 = '─' * 68
+_BAR_DASH_66 = '─' * 66
+_BAR_DASH_50 = '─' * 50
+_HEADER_RULE = f"{'─' * 40} {'─' * 13} {'─' * 13}"
+_SLAB_RULE = f"{'─' * 25} {'─' * 10}"
+
+# Fixed parts of headers, section boxes and table headings
+_HEADER_BAR = f"{BOLD_HEADER}{_BAR_EQ_70}{END}"
+_SECTION_TOP = f"{BOLD_CYAN}┌{_BAR_DASH_68}┐{END}"
+_SECTION_BOTTOM = f"{BOLD_CYAN}└{_BAR_DASH_68}┘{END}"
+_ASSESSMENT_YEAR_LINE = f"{CYAN}Assessment Year: 2026-27 (Financial Year: 2025-26){END}"
+_COLUMN_TITLES = f"\n  {'PARTICULARS':<40} {'OLD REGIME':>13} {'NEW REGIME':>13}\n  {_HEADER_RULE}"
+
+class _Out:
+    """Accumulates report output so it reaches stdout in a single write."""
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, text: str):
+        """Append text without a trailing newline."""
+        self.parts.append(text)
+
+    def line(self, text: str = ''):
+        """Append text followed by a newline."""
+        self.parts.append(text)
+        self.parts.append('\n')
+
+    def amount(self, amount: float, width: int):
+        """Append a rupee amount, right-aligned to width columns."""
+        self.parts.append(_fmt_rupees(round(amount)).rjust(width))
+
+    def cell(self, amount: Optional[float], width: int):
+        """Append a rupee amount, or a '-' placeholder when it is missing."""
+        if amount is None:
+            self.parts.append('-'.rjust(width))
+        else:
+            self.amount(amount, width)
+
+    def flush(self):
+        """Write the buffered output to stdout and reset the buffer."""
+        sys.stdout.write(''.join(self.parts))
+        sys.stdout.flush()
+        self.parts.clear()
+
+
+def _fmt_rupees(n: int) -> str:
+    """Format whole rupees with thousands separators."""
+    if n < 0:
+        return f"-₹{-n:,}"
+    return f"₹{n:,}"
+
+
+@lru_cache(maxsize=512)
 def format_currency(amount: float) -> str:
     """Format amount in Indian currency style."""
-    if amount < 0:
-        return f"-₹{abs(amount):,.0f}"
-    return f"₹{amount:,.0f}"
+    return _fmt_rupees(round(amount))
 
 
+@lru_cache(maxsize=512)
 def format_lakhs(amount: float) -> str:
     """Format amount in lakhs."""
     lakhs = amount / 100000
     return f"₹{lakhs:.2f}L"
 
 
-def print_header(title: str):
+def print_header(out: _Out, title: str):
     """Print a formatted header."""
-    print(f"\n{Colors.BOLD}{Colors.HEADER}{'═' * 70}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{title.center(70)}{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{'═' * 70}{Colors.END}")
+    out.line(f"\n{_HEADER_BAR}\n{BOLD_HEADER}{title.center(70)}{END}\n{_HEADER_BAR}")
+
 
+def _section_text(title: str) -> str:
+    """Build the boxed section header for a title."""
+    return f"\n{_SECTION_TOP}\n{BOLD_CYAN}│ {title:<66} │{END}\n{_SECTION_BOTTOM}"
 
-def print_section(title: str):
+
+def print_section(out: _Out, title: str):
     """Print a section header."""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}┌{'─' * 68}┐{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.CYAN}│ {title:<66} │{Colors.END}")
-    print(f"{Colors.BOLD}{Colors.CYAN}└{'─' * 68}┘{Colors.END}")
+    out.line(_section_text(title))
 
 
-def print_row(label: str, old_value: str, new_value: str, highlight: bool = False):
+def print_row(out: _Out, label: str, old_value: str, new_value: str, highlight: bool = False):
     """Print a comparison row."""
-    color = Colors.YELLOW if highlight else ''
-    end = Colors.END if highlight else ''
-    print(f"  {color}{label:<40} {old_value:>13} {new_value:>13}{end}")
+    color, end = (YELLOW, END) if highlight else ('', '')
+    out.line(''.join(('  ', color, label.ljust(40), ' ', old_value.rjust(13), ' ', new_value.rjust(13), end)))
 
 
-def print_single_row(label: str, value: str):
-    """Print a single value row."""
-    print(f"  {label:<40} {value:>27}")
+def print_amount_row(out: _Out, label: str, old_amount: float, new_amount: float,
+                     highlight: bool = False):
+    """Print a comparison row of rupee amounts."""
+    color, end = (YELLOW, END) if highlight else ('', '')
+    out.write(''.join(('  ', color, label.ljust(40), ' ')))
+    out.amount(old_amount, 13)
+    out.write(' ')
+    out.amount(new_amount, 13)
+    out.line(end)
 
 
-def print_dict_rows(title: str, old_dict: dict, new_dict: dict):
-    """Print dictionary items as rows."""
-    all_keys = set(old_dict.keys()) | set(new_dict.keys())
-    if not all_keys:
-        return
+def print_single_row(out: _Out, label: str, value: str):
+    """Print a single value row."""
+    out.line(f"  {label:<40} {value:>27}")
 
-    print(f"\n  {Colors.UNDERLINE}{title}{Colors.END}")
-    for key in sorted(all_keys):
-        old_val = format_currency(old_dict.get(key, 0)) if key in old_dict else "-"
-        new_val = format_currency(new_dict.get(key, 0)) if key in new_dict else "-"
-        print(f"    {key:<38} {old_val:>13} {new_val:>13}")
 
+def print_dict_rows(out: _Out, title: str, keys: tuple, old_dict: dict, new_dict: dict):
+    """Print dictionary items as rows, in the order given by keys."""
+    if not any(old_dict.values()) and not any(new_dict.values()):
+        return
 
-def print_comparison_table(old: TaxBreakdown, new: TaxBreakdown):
+    old_get = old_dict.get
+    new_get = new_dict.get
+    out.line(f"\n  {UNDERLINE}{title}{END}")
+    for key in keys:
+        out.write('    ' + key.ljust(38) + ' ')
+        out.cell(old_get(key), 13)
+        out.write(' ')
+        out.cell(new_get(key), 13)
+        out.line()
+
+
+# Recommendation text indexed by the sign of (old tax - new tax)
+_RECOMMENDATIONS = (
+    f"\n  {YELLOW}Both regimes result in the same tax liability.{END}\n"
+    f"  {YELLOW}New Regime is simpler with fewer compliance requirements.{END}",
+    f"\n  {BOLD_GREEN}✓ NEW TAX REGIME is better for you!{END}\n"
+    f"  {GREEN}  You save {{amount}} by choosing New Regime{END}",
+    f"\n  {BOLD_GREEN}✓ OLD TAX REGIME is better for you!{END}\n"
+    f"  {GREEN}  You save {{amount}} by choosing Old Regime{END}",
+)
+
+_SUMMARY_TOP = f"  ┌{'─' * 67}┐"
+_SUMMARY_DIVIDER = f"  ├{'─' * 67}┤"
+_SUMMARY_BOTTOM = f"  └{'─' * 67}┘"
+_SUMMARY_PAD = ' ' * 30
+
+
+def _summary_lines(title: str, breakdown: 'TaxBreakdown') -> list:
+    """Build the summary box lines for one regime."""
+    total_deductions = (
+        breakdown.total_exemptions +
+        breakdown.total_section_16 +
+        breakdown.total_chapter_via
+    )
+    return [
+        "  │  " + BOLD + title + END + ' ' * (65 - len(title)) + "│",
+        "  │    Gross Salary:     " + format_lakhs(breakdown.gross_salary).rjust(12) + _SUMMARY_PAD + "│",
+        "  │    Total Deductions: " + format_lakhs(total_deductions).rjust(12) + _SUMMARY_PAD + "│",
+        "  │    Taxable Income:   " + format_lakhs(breakdown.taxable_income).rjust(12) + _SUMMARY_PAD + "│",
+        "  │    Total Tax:        " + format_lakhs(breakdown.total_tax).rjust(12) + _SUMMARY_PAD + "│",
+    ]
+
+
+def print_comparison_table(out: _Out, v: ModuleType, old: 'TaxBreakdown', new: 'TaxBreakdown'):
     """Print detailed comparison table."""
+    exemption_keys = tuple(sorted(old.exemptions.keys() | new.exemptions.keys()))
+    section_16_keys = tuple(sorted(old.section_16_deductions.keys() | new.section_16_deductions.keys()))
+    chapter_via_keys = tuple(sorted(old.chapter_via_deductions.keys() | new.chapter_via_deductions.keys()))
 
-    print_header("INDIA TAX REGIME COMPARISON")
-    print(f"{Colors.CYAN}Assessment Year: 2026-27 (Financial Year: 2025-26){Colors.END}")
-    print(f"{Colors.CYAN}Age Category: {v.age_category.replace('_', ' ').title()}{Colors.END}")
+    print_header(out, "INDIA TAX REGIME COMPARISON")
+    out.line(_ASSESSMENT_YEAR_LINE)
+    out.line(f"{CYAN}Age Category: {v.age_category.replace('_', ' ').title()}{END}")
 
     # Column Headers
-    print_section("COMPARISON")
-    print(f"\n  {'PARTICULARS':<40} {'OLD REGIME':>13} {'NEW REGIME':>13}")
-    print(f"  {'─' * 40} {'─' * 13} {'─' * 13}")
+    print_section(out, "COMPARISON")
+    out.line(_COLUMN_TITLES)
 
     # Gross Salary
-    print_row("Gross Salary",
-              format_currency(old.gross_salary),
-              format_currency(new.gross_salary))
+    print_amount_row(out, "Gross Salary",
+                     old.gross_salary,
+                     new.gross_salary)
 
     # Exemptions
-    print_dict_rows("Section 10 Exemptions", old.exemptions, new.exemptions)
-    print_row("Total Exemptions",
-              format_currency(old.total_exemptions),
-              format_currency(new.total_exemptions),
-              highlight=True)
+    print_dict_rows(out, "Section 10 Exemptions", exemption_keys, old.exemptions, new.exemptions)
+    print_amount_row(out, "Total Exemptions",
+                     old.total_exemptions,
+                     new.total_exemptions,
+                     highlight=True)
 
     # Income from Salary
-    print(f"\n  {'─' * 66}")
-    print_row("Income from Salary",
-              format_currency(old.income_from_salary),
-              format_currency(new.income_from_salary))
+    out.line(f"\n  {_BAR_DASH_66}")
+    print_amount_row(out, "Income from Salary",
+                     old.income_from_salary,
+                     new.income_from_salary)
 
     # Section 16 Deductions
-    print_dict_rows("Section 16 Deductions", old.section_16_deductions, new.section_16_deductions)
-    print_row("Total Section 16",
-              format_currency(old.total_section_16),
-              format_currency(new.total_section_16),
-              highlight=True)
+    print_dict_rows(out, "Section 16 Deductions", section_16_keys, old.section_16_deductions, new.section_16_deductions)
+    print_amount_row(out, "Total Section 16",
+                     old.total_section_16,
+                     new.total_section_16,
+                     highlight=True)
 
     # Net Salary Income
-    print(f"\n  {'─' * 66}")
-    print_row("Net Salary Income",
-              format_currency(old.net_salary_income),
-              format_currency(new.net_salary_income))
+    out.line(f"\n  {_BAR_DASH_66}")
+    print_amount_row(out, "Net Salary Income",
+                     old.net_salary_income,
+                     new.net_salary_income)
 
     # House Property Income
     if old.income_from_house_property != 0 or new.income_from_house_property != 0:
-        print_row("Income from House Property",
-                  format_currency(old.income_from_house_property),
-                  format_currency(new.income_from_house_property))
+        print_amount_row(out, "Income from House Property",
+                         old.income_from_house_property,
+                         new.income_from_house_property)
 
     # Other Income
     if old.other_income > 0 or new.other_income > 0:
-        print_row("Other Income",
-                  format_currency(old.other_income),
-                  format_currency(new.other_income))
+        print_amount_row(out, "Other Income",
+                         old.other_income,
+                         new.other_income)
 
     # Gross Total Income
-    print(f"\n  {'─' * 66}")
-    print_row("GROSS TOTAL INCOME",
-              format_currency(old.gross_total_income),
-              format_currency(new.gross_total_income),
-              highlight=True)
+    out.line(f"\n  {_BAR_DASH_66}")
+    print_amount_row(out, "GROSS TOTAL INCOME",
+                     old.gross_total_income,
+                     new.gross_total_income,
+                     highlight=True)
 
     # Chapter VI-A Deductions
-    print_dict_rows("Chapter VI-A Deductions", old.chapter_via_deductions, new.chapter_via_deductions)
-    print_row("Total Chapter VI-A",
-              format_currency(old.total_chapter_via),
-              format_currency(new.total_chapter_via),
-              highlight=True)
+    print_dict_rows(out, "Chapter VI-A Deductions", chapter_via_keys, old.chapter_via_deductions, new.chapter_via_deductions)
+    print_amount_row(out, "Total Chapter VI-A",
+                     old.total_chapter_via,
+                     new.total_chapter_via,
+                     highlight=True)
 
     # Taxable Income
-    print(f"\n  {'─' * 66}")
-    print_row("TAXABLE INCOME",
-              format_currency(old.taxable_income),
-              format_currency(new.taxable_income),
-              highlight=True)
+    out.line(f"\n  {_BAR_DASH_66}")
+    print_amount_row(out, "TAXABLE INCOME",
+                     old.taxable_income,
+                     new.taxable_income,
+                     highlight=True)
 
     # Tax Calculation
-    print_section("TAX CALCULATION")
-    print(f"\n  {'PARTICULARS':<40} {'OLD REGIME':>13} {'NEW REGIME':>13}")
-    print(f"  {'─' * 40} {'─' * 13} {'─' * 13}")
+    print_section(out, "TAX CALCULATION")
+    out.line(_COLUMN_TITLES)
 
-    print_row("Tax on Income",
-              format_currency(old.tax_on_income),
-              format_currency(new.tax_on_income))
+    print_amount_row(out, "Tax on Income",
+                     old.tax_on_income,
+                     new.tax_on_income)
 
-    print_row("Less: Rebate u/s 87A",
-              format_currency(old.rebate_87a),
-              format_currency(new.rebate_87a))
+    print_amount_row(out, "Less: Rebate u/s 87A",
+                     old.rebate_87a,
+                     new.rebate_87a)
 
-    print_row("Tax after Rebate",
-              format_currency(old.tax_after_rebate),
-              format_currency(new.tax_after_rebate))
+    print_amount_row(out, "Tax after Rebate",
+                     old.tax_after_rebate,
+                     new.tax_after_rebate)
 
     if old.surcharge > 0 or new.surcharge > 0:
-        print_row("Add: Surcharge",
-                  format_currency(old.surcharge),
-                  format_currency(new.surcharge))
+        print_amount_row(out, "Add: Surcharge",
+                         old.surcharge,
+                         new.surcharge)
 
-    print_row("Add: Health & Education Cess (4%)",
-              format_currency(old.cess),
-              format_currency(new.cess))
+    print_amount_row(out, "Add: Health & Education Cess (4%)",
+                     old.cess,
+                     new.cess)
 
-    print(f"\n  {'─' * 66}")
-    print_row("TOTAL TAX PAYABLE",
-              format_currency(old.total_tax),
-              format_currency(new.total_tax),
-              highlight=True)
+    out.line(f"\n  {_BAR_DASH_66}")
+    print_amount_row(out, "TOTAL TAX PAYABLE",
+                     old.total_tax,
+                     new.total_tax,
+                     highlight=True)
 
     # Effective Tax Rate
-    print(f"\n  {'─' * 66}")
-    print_row("Effective Tax Rate",
+    out.line(f"\n  {_BAR_DASH_66}")
+    print_row(out, "Effective Tax Rate",
               f"{old.effective_tax_rate:.2f}%",
               f"{new.effective_tax_rate:.2f}%")
 
     # TDS Already Paid
     if v.tds_deducted > 0 or v.advance_tax_paid > 0:
         total_paid = v.tds_deducted + v.advance_tax_paid
-        print(f"\n  {'─' * 66}")
-        print_single_row("TDS Deducted", format_currency(v.tds_deducted))
-        print_single_row("Advance Tax Paid", format_currency(v.advance_tax_paid))
+        out.line(f"\n  {_BAR_DASH_66}")
+        print_single_row(out, "TDS Deducted", format_currency(v.tds_deducted))
+        print_single_row(out, "Advance Tax Paid", format_currency(v.advance_tax_paid))
         old_balance = old.total_tax - total_paid
         new_balance = new.total_tax - total_paid
-        print_row("Balance Tax Payable / (Refund)",
-                  format_currency(old_balance),
-                  format_currency(new_balance),
-                  highlight=True)
+        print_amount_row(out, "Balance Tax Payable / (Refund)",
+                         old_balance,
+                         new_balance,
+                         highlight=True)
 
     # Recommendation
-    print_section("RECOMMENDATION")
+    print_section(out, "RECOMMENDATION")
 
     savings = old.total_tax - new.total_tax
-
-    if savings > 0:
-        print(f"\n  {Colors.GREEN}{Colors.BOLD}✓ NEW TAX REGIME is better for you!{Colors.END}")
-        print(f"  {Colors.GREEN}  You save {format_currency(savings)} by choosing New Regime{Colors.END}")
-    elif savings < 0:
-        print(f"\n  {Colors.GREEN}{Colors.BOLD}✓ OLD TAX REGIME is better for you!{Colors.END}")
-        print(f"  {Colors.GREEN}  You save {format_currency(abs(savings))} by choosing Old Regime{Colors.END}")
-    else:
-        print(f"\n  {Colors.YELLOW}Both regimes result in the same tax liability.{Colors.END}")
-        print(f"  {Colors.YELLOW}New Regime is simpler with fewer compliance requirements.{Colors.END}")
+    sign = (savings > 0) - (savings < 0)
+    out.line(_RECOMMENDATIONS[sign].format(amount=format_currency(abs(savings))))
 
     # Summary Box
-    print_section("SUMMARY")
-    print(f"""
-  ┌───────────────────────────────────────────────────────────────────┐
-  │  {Colors.BOLD}OLD REGIME{Colors.END}                                                       │
-  │    Gross Salary:     {format_lakhs(old.gross_salary):>12}                              │
-  │    Total Deductions: {format_lakhs(old.total_exemptions + old.total_section_16 + old.total_chapter_via):>12}                              │
-  │    Taxable Income:   {format_lakhs(old.taxable_income):>12}                              │
-  │    Total Tax:        {format_lakhs(old.total_tax):>12}                              │
-  ├───────────────────────────────────────────────────────────────────┤
-  │  {Colors.BOLD}NEW REGIME{Colors.END}                                                       │
-  │    Gross Salary:     {format_lakhs(new.gross_salary):>12}                              │
-  │    Total Deductions: {format_lakhs(new.total_exemptions + new.total_section_16 + new.total_chapter_via):>12}                              │
-  │    Taxable Income:   {format_lakhs(new.taxable_income):>12}                              │
-  │    Total Tax:        {format_lakhs(new.total_tax):>12}                              │
-  └───────────────────────────────────────────────────────────────────┘
-""")
-
-
-def print_tax_slabs():
+    print_section(out, "SUMMARY")
+    lines = [
+        "",
+        _SUMMARY_TOP,
+        *_summary_lines("OLD REGIME", old),
+        _SUMMARY_DIVIDER,
+        *_summary_lines("NEW REGIME", new),
+        _SUMMARY_BOTTOM,
+        "",
+    ]
+    out.line("\n".join(lines))
+
+
+def _slab_table(title: str, slabs: tuple) -> tuple:
+    """Build the formatted lines of a tax slab table."""
+    return (
+        f"\n  {BOLD}{title}{END}",
+        f"  {'Income Slab':<25} {'Tax Rate':>10}",
+        f"  {_SLAB_RULE}",
+        *(f"  {slab:<25} {rate:>10}" for slab, rate in slabs),
+    )
+
+
+def _limits_table(title: str, limits: tuple) -> tuple:
+    """Build the formatted lines of a deduction limits table."""
+    return (
+        f"\n  {BOLD}{title}{END}",
+        f"  {_BAR_DASH_50}",
+        *(f"  {section:<35} {limit:>15}" for section, limit in limits),
+    )
+
+
+# Tax slab and deduction limit tables are constant, so format them once at import
+_NEW_REGIME_SLAB_LINES = _slab_table("NEW TAX REGIME (Default)", (
+    ('Up to ₹4,00,000', 'Nil'),
+    ('₹4,00,001 - ₹8,00,000', '5%'),
+    ('₹8,00,001 - ₹12,00,000', '10%'),
+    ('₹12,00,001 - ₹16,00,000', '15%'),
+    ('₹16,00,001 - ₹20,00,000', '20%'),
+    ('₹20,00,001 - ₹24,00,000', '25%'),
+    ('Above ₹24,00,000', '30%'),
+)) + (
+    f"\n  {CYAN}Rebate: ₹60,000 if income ≤ ₹12,00,000{END}",
+    f"  {CYAN}Standard Deduction: ₹75,000{END}",
+)
+
+_OLD_REGIME_SLAB_LINES = _slab_table("OLD TAX REGIME (Below 60 Years)", (
+    ('Up to ₹2,50,000', 'Nil'),
+    ('₹2,50,001 - ₹5,00,000', '5%'),
+    ('₹5,00,001 - ₹10,00,000', '20%'),
+    ('Above ₹10,00,000', '30%'),
+)) + (
+    f"\n  {CYAN}Rebate: ₹12,500 if income ≤ ₹5,00,000{END}",
+    f"  {CYAN}Standard Deduction: ₹50,000{END}",
+)
+
+_SENIOR_SLAB_LINES = _slab_table("OLD TAX REGIME (Senior Citizen: 60-80 Years)", (
+    ('Up to ₹3,00,000', 'Nil'),
+    ('₹3,00,001 - ₹5,00,000', '5%'),
+    ('₹5,00,001 - ₹10,00,000', '20%'),
+    ('Above ₹10,00,000', '30%'),
+))
+
+_SUPER_SENIOR_SLAB_LINES = _slab_table("OLD TAX REGIME (Super Senior Citizen: 80+ Years)", (
+    ('Up to ₹5,00,000', 'Nil'),
+    ('₹5,00,001 - ₹10,00,000', '20%'),
+    ('Above ₹10,00,000', '30%'),
+))
+
+_DEDUCTION_LIMIT_LINES = _limits_table("Section 10 Exemptions", (
+    ('HRA [10(13A)]', 'As per formula'),
+    ('LTA [10(5)]', 'Actual expenses'),
+    ('Children Education [10(14)(ii)]', '₹100/month/child'),
+    ('Hostel [10(14)(ii)]', '₹300/month/child'),
+    ('Helper/Driver [10(14)(i)]', 'Actual expenses'),
+    ('Gratuity [10(10)] - Old', '₹20,00,000'),
+    ('Gratuity [10(10)] - New', '₹5,00,000'),
+    ('Leave Encashment [10(10AA)]', '₹25,00,000'),
+)) + _limits_table("Chapter VI-A Deductions (Old Regime Only)", (
+    ('80C (Combined)', '₹1,50,000'),
+    ('80CCD(1B) - Additional NPS', '₹50,000'),
+    ('80CCD(2) - Employer NPS (Both)', '14% of Basic+DA'),
+    ('80D - Self/Family', '₹25,000/₹50,000'),
+    ('80D - Parents', '₹25,000/₹50,000'),
+    ('80DD - Disabled Dependent', '₹75,000/₹1,25,000'),
+    ('80DDB - Medical Treatment', '₹40,000/₹1,00,000'),
+    ('80E - Education Loan Interest', 'No limit'),
+    ('80EE - Home Loan Interest', '₹50,000'),
+    ('80EEA - Add. Home Loan', '₹1,50,000'),
+    ('80EEB - EV Loan Interest', '₹1,50,000'),
+    ('80G - Donations', '50%/100%'),
+    ('80GG - Rent (No HRA)', '₹60,000/year'),
+    ('80TTA - Savings Interest', '₹10,000'),
+    ('80TTB - Senior Interest', '₹50,000'),
+)) + _limits_table("Section 24 - Home Loan Interest", (
+    ('Self-Occupied (Old Regime)', '₹2,00,000'),
+    ('Let-Out Property (Both)', 'No limit'),
+))
+
+
+# Both reference sections depend only on the age category, so each
+# variant is rendered to a single string at import
+_SLABS_DEFAULT = "\n".join((
+    _section_text("TAX SLABS (FY 2025-26)"),
+    *_NEW_REGIME_SLAB_LINES,
+    *_OLD_REGIME_SLAB_LINES,
+))
+_SLABS_BY_AGE = {
+    'senior': "\n".join((_SLABS_DEFAULT, *_SENIOR_SLAB_LINES)),
+    'super_senior': "\n".join((_SLABS_DEFAULT, *_SUPER_SENIOR_SLAB_LINES)),
+}
+_DEDUCTION_LIMITS_TEXT = "\n".join((
+    _section_text("DEDUCTION LIMITS REFERENCE"),
+    *_DEDUCTION_LIMIT_LINES,
+))
+
+
+def print_tax_slabs(out: _Out, age_category: str):
     """Print tax slab information."""
-    print_section("TAX SLABS (FY 2025-26)")
-
-    print(f"\n  {Colors.BOLD}NEW TAX REGIME (Default){Colors.END}")
-    print(f"  {'Income Slab':<25} {'Tax Rate':>10}")
-    print(f"  {'─' * 25} {'─' * 10}")
-    print(f"  {'Up to ₹4,00,000':<25} {'Nil':>10}")
-    print(f"  {'₹4,00,001 - ₹8,00,000':<25} {'5%':>10}")
-    print(f"  {'₹8,00,001 - ₹12,00,000':<25} {'10%':>10}")
-    print(f"  {'₹12,00,001 - ₹16,00,000':<25} {'15%':>10}")
-    print(f"  {'₹16,00,001 - ₹20,00,000':<25} {'20%':>10}")
-    print(f"  {'₹20,00,001 - ₹24,00,000':<25} {'25%':>10}")
-    print(f"  {'Above ₹24,00,000':<25} {'30%':>10}")
-    print(f"\n  {Colors.CYAN}Rebate: ₹60,000 if income ≤ ₹12,00,000{Colors.END}")
-    print(f"  {Colors.CYAN}Standard Deduction: ₹75,000{Colors.END}")
-
-    print(f"\n  {Colors.BOLD}OLD TAX REGIME (Below 60 Years){Colors.END}")
-    print(f"  {'Income Slab':<25} {'Tax Rate':>10}")
-    print(f"  {'─' * 25} {'─' * 10}")
-    print(f"  {'Up to ₹2,50,000':<25} {'Nil':>10}")
-    print(f"  {'₹2,50,001 - ₹5,00,000':<25} {'5%':>10}")
-    print(f"  {'₹5,00,001 - ₹10,00,000':<25} {'20%':>10}")
-    print(f"  {'Above ₹10,00,000':<25} {'30%':>10}")
-    print(f"\n  {Colors.CYAN}Rebate: ₹12,500 if income ≤ ₹5,00,000{Colors.END}")
-    print(f"  {Colors.CYAN}Standard Deduction: ₹50,000{Colors.END}")
-
-    if v.age_category == 'senior':
-        print(f"\n  {Colors.BOLD}OLD TAX REGIME (Senior Citizen: 60-80 Years){Colors.END}")
-        print(f"  {'Income Slab':<25} {'Tax Rate':>10}")
-        print(f"  {'─' * 25} {'─' * 10}")
-        print(f"  {'Up to ₹3,00,000':<25} {'Nil':>10}")
-        print(f"  {'₹3,00,001 - ₹5,00,000':<25} {'5%':>10}")
-        print(f"  {'₹5,00,001 - ₹10,00,000':<25} {'20%':>10}")
-        print(f"  {'Above ₹10,00,000':<25} {'30%':>10}")
-
-    if v.age_category == 'super_senior':
-        print(f"\n  {Colors.BOLD}OLD TAX REGIME (Super Senior Citizen: 80+ Years){Colors.END}")
-        print(f"  {'Income Slab':<25} {'Tax Rate':>10}")
-        print(f"  {'─' * 25} {'─' * 10}")
-        print(f"  {'Up to ₹5,00,000':<25} {'Nil':>10}")
-        print(f"  {'₹5,00,001 - ₹10,00,000':<25} {'20%':>10}")
-        print(f"  {'Above ₹10,00,000':<25} {'30%':>10}")
-
-
-def print_deduction_limits():
+    out.line(_SLABS_BY_AGE.get(age_category, _SLABS_DEFAULT))
+
+
+def print_deduction_limits(out: _Out):
     """Print deduction limits summary."""
-    print_section("DEDUCTION LIMITS REFERENCE")
-
-    print(f"\n  {Colors.BOLD}Section 10 Exemptions{Colors.END}")
-    print(f"  {'─' * 50}")
-    print(f"  {'HRA [10(13A)]':<35} {'As per formula':>15}")
-    print(f"  {'LTA [10(5)]':<35} {'Actual expenses':>15}")
-    print(f"  {'Children Education [10(14)(ii)]':<35} {'₹100/month/child':>15}")
-    print(f"  {'Hostel [10(14)(ii)]':<35} {'₹300/month/child':>15}")
-    print(f"  {'Helper/Driver [10(14)(i)]':<35} {'Actual expenses':>15}")
-    print(f"  {'Gratuity [10(10)] - Old':<35} {'₹20,00,000':>15}")
-    print(f"  {'Gratuity [10(10)] - New':<35} {'₹5,00,000':>15}")
-    print(f"  {'Leave Encashment [10(10AA)]':<35} {'₹25,00,000':>15}")
-
-    print(f"\n  {Colors.BOLD}Chapter VI-A Deductions (Old Regime Only){Colors.END}")
-    print(f"  {'─' * 50}")
-    print(f"  {'80C (Combined)':<35} {'₹1,50,000':>15}")
-    print(f"  {'80CCD(1B) - Additional NPS':<35} {'₹50,000':>15}")
-    print(f"  {'80CCD(2) - Employer NPS (Both)':<35} {'14% of Basic+DA':>15}")
-    print(f"  {'80D - Self/Family':<35} {'₹25,000/₹50,000':>15}")
-    print(f"  {'80D - Parents':<35} {'₹25,000/₹50,000':>15}")
-    print(f"  {'80DD - Disabled Dependent':<35} {'₹75,000/₹1,25,000':>15}")
-    print(f"  {'80DDB - Medical Treatment':<35} {'₹40,000/₹1,00,000':>15}")
-    print(f"  {'80E - Education Loan Interest':<35} {'No limit':>15}")
-    print(f"  {'80EE - Home Loan Interest':<35} {'₹50,000':>15}")
-    print(f"  {'80EEA - Add. Home Loan':<35} {'₹1,50,000':>15}")
-    print(f"  {'80EEB - EV Loan Interest':<35} {'₹1,50,000':>15}")
-    print(f"  {'80G - Donations':<35} {'50%/100%':>15}")
-    print(f"  {'80GG - Rent (No HRA)':<35} {'₹60,000/year':>15}")
-    print(f"  {'80TTA - Savings Interest':<35} {'₹10,000':>15}")
-    print(f"  {'80TTB - Senior Interest':<35} {'₹50,000':>15}")
-
-    print(f"\n  {Colors.BOLD}Section 24 - Home Loan Interest{Colors.END}")
-    print(f"  {'─' * 50}")
-    print(f"  {'Self-Occupied (Old Regime)':<35} {'₹2,00,000':>15}")
-    print(f"  {'Let-Out Property (Both)':<35} {'No limit':>15}")
+    out.line(_DEDUCTION_LIMITS_TEXT)
 
 
 def main():
     """Main function to run the tax comparison."""
+    out = _Out()
+
+    # Load the configuration only when run, not when this module is imported
+    import variables as v
+
     # Check if any salary component is set
     if v.basic_salary == 0:
-        print(f"\n{Colors.RED}⚠ No salary data found!{Colors.END}")
-        print(f"\nPlease update the values in {Colors.BOLD}variables.py{Colors.END} file.")
-        print("\nExample:")
-        print("  basic_salary = 1200000  # ₹12 Lakh per year")
-        print("  hra_received = 480000   # ₹4.8 Lakh per year")
-        print("  ... and so on")
-        print_deduction_limits()
+        out.line(f"\n{RED}⚠ No salary data found!{END}")
+        out.line(f"\nPlease update the values in {BOLD}variables.py{END} file.")
+        out.line("\nExample:")
+        out.line("  basic_salary = 1200000  # ₹12 Lakh per year")
+        out.line("  hra_received = 480000   # ₹4.8 Lakh per year")
+        out.line("  ... and so on")
+        print_deduction_limits(out)
+        out.flush()
         return
 
     # Calculate and compare
+    from tax_calculator import compare_regimes
     old_regime, new_regime = compare_regimes()
 
     # Print comparison
-    print_comparison_table(old_regime, new_regime)
+    print_comparison_table(out, v, old_regime, new_regime)
 
     # Print tax slabs
-    print_tax_slabs()
+    print_tax_slabs(out, v.age_category)
+
+    out.flush()
 
 
 if __name__ == "__main__":
@@ -5,10 +5,16 @@ Assessment Year: 2026-27 (Financial Year: 2025-26)
 Compares Old Tax Regime vs New Tax Regime and calculates effective tax.
 """
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Tuple
+from bisect import bisect_left
+from dataclasses import dataclass, field, fields, replace
+from functools import lru_cache
+from types import MappingProxyType, ModuleType
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 import variables as v
 
+# Source of the calculation inputs: the variables module or a TaxInputs record
+Inputs = Union[v.TaxInputs, ModuleType]
+
 
 # =============================================================================
 # TAX SLABS AND LIMITS (FY 2025-26 / AY 2026-27)
@@ -108,22 +114,49 @@ LIMITS = {
     'cess_rate': 0.04,
 }
 
+# Caps derived from the per-month and per-meal limits above
+TRANSPORT_DISABLED_ANNUAL = LIMITS['transport_disabled_monthly'] * 12
+CHILDREN_EDUCATION_ANNUAL_PER_CHILD = LIMITS['children_education_per_child_monthly'] * 12
+HOSTEL_ANNUAL_PER_CHILD = LIMITS['hostel_per_child_monthly'] * 12
+RENT_80GG_ANNUAL = LIMITS['80gg_monthly'] * 12
+MEAL_EXEMPT_PER_DAY = LIMITS['meal_per_meal'] * 2  # 2 meals/day
+
+# Section 87A rebate per regime: (taxable income limit, maximum rebate)
+REBATE_87A = {
+    'old': (LIMITS['rebate_87a_old_limit'], LIMITS['rebate_87a_old_amount']),
+    'new': (LIMITS['rebate_87a_new_limit'], LIMITS['rebate_87a_new_amount']),
+}
+
+# Surcharge per regime: (income thresholds, rate above none/each threshold)
+SURCHARGE_TABLE = {
+    # Old regime: Max surcharge 37%
+    'old': (
+        (LIMITS['surcharge_50l'], LIMITS['surcharge_1cr'], LIMITS['surcharge_2cr'], LIMITS['surcharge_5cr']),
+        (0, 0.10, 0.15, 0.25, 0.37),
+    ),
+    # New regime: Max surcharge 25%
+    'new': (
+        (LIMITS['surcharge_50l'], LIMITS['surcharge_1cr'], LIMITS['surcharge_2cr']),
+        (0, 0.10, 0.15, 0.25),
+    ),
+}
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TaxBreakdown:
     """Stores detailed tax calculation breakdown."""
     regime: str
     gross_salary: float = 0
 
     # Exemptions
-    exemptions: Dict[str, float] = field(default_factory=dict)
+    exemptions: Mapping[str, float] = field(default_factory=dict)
     total_exemptions: float = 0
 
     # Income from Salary
     income_from_salary: float = 0
 
     # Section 16 Deductions
-    section_16_deductions: Dict[str, float] = field(default_factory=dict)
+    section_16_deductions: Mapping[str, float] = field(default_factory=dict)
     total_section_16: float = 0
 
     # Net Salary Income
@@ -139,7 +172,7 @@ class TaxBreakdown:
     gross_total_income: float = 0
 
     # Chapter VI-A Deductions
-    chapter_via_deductions: Dict[str, float] = field(default_factory=dict)
+    chapter_via_deductions: Mapping[str, float] = field(default_factory=dict)
     total_chapter_via: float = 0
 
     # Taxable Income
@@ -156,189 +189,223 @@ class TaxBreakdown:
     # Effective Tax Rate
     effective_tax_rate: float = 0
 
+    def as_dict(self) -> Dict[str, object]:
+        """Return the breakdown as a flat dict of field name to value."""
+        return {name: getattr(self, name) for name in self._field_names}
+
+
+# Field names cached once for as_dict()
+TaxBreakdown._field_names = tuple(f.name for f in fields(TaxBreakdown))
+
+
+@dataclass(slots=True)
+class _Ctx:
+    """Regime-independent values shared by both regimes' calculations."""
+    gross_salary: float
+    other_income: float
+    basic_plus_da: float
+    max_employer_nps: float
+    education_cap: float
+    hostel_cap: float
+
+
+def _context(inputs: Inputs = v) -> _Ctx:
+    """Compute the shared values once per set of inputs."""
+    basic_plus_da = inputs.basic_salary + inputs.dearness_allowance
+    num_children = min(inputs.number_of_children, LIMITS['max_children_for_exemption'])
+    return _Ctx(
+        gross_salary=calculate_gross_salary(inputs),
+        other_income=inputs.interest_income_other + inputs.other_income + inputs.savings_account_interest,
+        basic_plus_da=basic_plus_da,
+        max_employer_nps=basic_plus_da * LIMITS['80ccd_2_percent'],
+        education_cap=num_children * CHILDREN_EDUCATION_ANNUAL_PER_CHILD,
+        hostel_cap=num_children * HOSTEL_ANNUAL_PER_CHILD,
+    )
+
 
-def calculate_hra_exemption() -> float:
-    """Calculate HRA exemption under Section 10(13A)."""
-    if v.hra_received == 0 or v.rent_paid_annual == 0:
+def _hra_exemption(inputs: Inputs, basic_plus_da: float) -> float:
+    """HRA exemption under Section 10(13A) given Basic+DA."""
+    if inputs.hra_received == 0 or inputs.rent_paid_annual == 0:
         return 0
 
-    basic_plus_da = v.basic_salary + v.dearness_allowance
-
     # Three conditions for HRA exemption
-    actual_hra = v.hra_received
-    rent_minus_10_percent = v.rent_paid_annual - (0.10 * basic_plus_da)
+    rent_minus_10_percent = inputs.rent_paid_annual - (0.10 * basic_plus_da)
 
-    if v.city_type == "metro":
+    if inputs.city_type == "metro":
         percent_of_salary = 0.50 * basic_plus_da
     else:
         percent_of_salary = 0.40 * basic_plus_da
 
     # Exemption is minimum of the three
-    exemption = max(0, min(actual_hra, rent_minus_10_percent, percent_of_salary))
-    return exemption
+    return max(0, min(inputs.hra_received, rent_minus_10_percent, percent_of_salary))
 
 
-def calculate_gross_salary() -> float:
+def calculate_hra_exemption(inputs: Inputs = v, ctx: Optional[_Ctx] = None) -> float:
+    """Calculate HRA exemption under Section 10(13A)."""
+    if ctx is None:
+        basic_plus_da = inputs.basic_salary + inputs.dearness_allowance
+    else:
+        basic_plus_da = ctx.basic_plus_da
+    return _hra_exemption(inputs, basic_plus_da)
+
+
+def calculate_gross_salary(inputs: Inputs = v) -> float:
     """Calculate total gross salary."""
     gross = (
-        v.basic_salary +
-        v.dearness_allowance +
-        v.hra_received +
-        v.lta_received +
-        v.conveyance_allowance +
-        v.special_allowance +
-        v.transport_allowance +
-        v.children_education_allowance +
-        v.hostel_allowance +
-        v.helper_allowance +
-        v.uniform_allowance +
-        v.meal_allowance +
-        v.bonus +
-        v.commission +
-        v.overtime_pay +
-        v.gratuity_received +
-        v.leave_encashment_received +
-        v.entertainment_allowance +
+        inputs.basic_salary +
+        inputs.dearness_allowance +
+        inputs.hra_received +
+        inputs.lta_received +
+        inputs.conveyance_allowance +
+        inputs.special_allowance +
+        inputs.transport_allowance +
+        inputs.children_education_allowance +
+        inputs.hostel_allowance +
+        inputs.helper_allowance +
+        inputs.uniform_allowance +
+        inputs.meal_allowance +
+        inputs.bonus +
+        inputs.commission +
+        inputs.overtime_pay +
+        inputs.gratuity_received +
+        inputs.leave_encashment_received +
+        inputs.entertainment_allowance +
         # Reimbursements / Perquisites
-        v.fuel_allowance +
-        v.vehicle_maintenance_allowance +
-        v.books_periodicals_allowance +
-        v.mobile_telephone_allowance +
-        v.broadband_allowance +
-        v.furniture_computer_allowance +
-        v.other_reimbursements
+        inputs.fuel_allowance +
+        inputs.vehicle_maintenance_allowance +
+        inputs.books_periodicals_allowance +
+        inputs.mobile_telephone_allowance +
+        inputs.broadband_allowance +
+        inputs.furniture_computer_allowance +
+        inputs.other_reimbursements
     )
 
     # Employer contributions (taxable portion if exceeds limit)
     employer_total = (
-        v.employer_epf_contribution +
-        v.employer_nps_contribution +
-        v.employer_superannuation_contribution
+        inputs.employer_epf_contribution +
+        inputs.employer_nps_contribution +
+        inputs.employer_superannuation_contribution
     )
-    if employer_total > LIMITS['employer_contribution_combined']:
-        gross += employer_total - LIMITS['employer_contribution_combined']
+    combined_limit = LIMITS['employer_contribution_combined']
+    if employer_total > combined_limit:
+        gross += employer_total - combined_limit
 
     return gross
 
 
-def calculate_exemptions_old_regime() -> Dict[str, float]:
+def calculate_exemptions_old_regime(inputs: Inputs = v, ctx: Optional[_Ctx] = None) -> Dict[str, float]:
     """Calculate Section 10 exemptions for Old Tax Regime."""
+    if ctx is None:
+        ctx = _context(inputs)
     exemptions = {}
 
     # HRA Exemption [10(13A)]
-    hra_exempt = calculate_hra_exemption()
+    hra_exempt = _hra_exemption(inputs, ctx.basic_plus_da)
     if hra_exempt > 0:
         exemptions['HRA Exemption [10(13A)]'] = hra_exempt
 
     # LTA Exemption [10(5)]
-    lta_exempt = min(v.lta_received, v.lta_claimed)
+    lta_exempt = min(inputs.lta_received, inputs.lta_claimed)
     if lta_exempt > 0:
         exemptions['LTA Exemption [10(5)]'] = lta_exempt
 
     # Children Education Allowance [10(14)(ii)]
-    num_children = min(v.number_of_children, LIMITS['max_children_for_exemption'])
-    education_exempt = min(
-        v.children_education_allowance,
-        num_children * LIMITS['children_education_per_child_monthly'] * 12
-    )
+    education_exempt = min(inputs.children_education_allowance, ctx.education_cap)
     if education_exempt > 0:
         exemptions['Children Education [10(14)(ii)]'] = education_exempt
 
     # Hostel Allowance [10(14)(ii)]
-    hostel_exempt = min(
-        v.hostel_allowance,
-        num_children * LIMITS['hostel_per_child_monthly'] * 12
-    )
+    hostel_exempt = min(inputs.hostel_allowance, ctx.hostel_cap)
     if hostel_exempt > 0:
         exemptions['Hostel Allowance [10(14)(ii)]'] = hostel_exempt
 
     # Helper Allowance [10(14)(i)]
-    helper_exempt = min(v.helper_allowance, v.helper_actual_expenses)
+    helper_exempt = min(inputs.helper_allowance, inputs.helper_actual_expenses)
     if helper_exempt > 0:
         exemptions['Helper/Driver [10(14)(i)]'] = helper_exempt
 
     # Uniform Allowance [10(14)(i)]
-    uniform_exempt = min(v.uniform_allowance, v.uniform_actual_expenses)
+    uniform_exempt = min(inputs.uniform_allowance, inputs.uniform_actual_expenses)
     if uniform_exempt > 0:
         exemptions['Uniform Allowance [10(14)(i)]'] = uniform_exempt
 
     # Conveyance Allowance [10(14)]
-    conveyance_exempt = min(v.conveyance_allowance, v.conveyance_actual_expenses)
+    conveyance_exempt = min(inputs.conveyance_allowance, inputs.conveyance_actual_expenses)
     if conveyance_exempt > 0:
         exemptions['Conveyance [10(14)]'] = conveyance_exempt
 
     # Transport Allowance for Disabled [10(14)]
-    if v.is_disabled:
+    if inputs.is_disabled:
         transport_exempt = min(
-            v.transport_allowance,
-            LIMITS['transport_disabled_monthly'] * 12
+            inputs.transport_allowance,
+            TRANSPORT_DISABLED_ANNUAL
         )
         if transport_exempt > 0:
             exemptions['Transport (Disabled) [10(14)]'] = transport_exempt
 
     # Meal Voucher Exemption (Rs 50/meal, 2 meals/day)
     meal_exempt = min(
-        v.meal_allowance,
-        LIMITS['meal_per_meal'] * 2 * v.number_of_working_days
+        inputs.meal_allowance,
+        MEAL_EXEMPT_PER_DAY * inputs.number_of_working_days
     )
     if meal_exempt > 0:
         exemptions['Meal Voucher Exemption'] = meal_exempt
 
     # Gratuity Exemption [10(10)]
-    gratuity_exempt = min(v.gratuity_received, LIMITS['gratuity_old'])
+    gratuity_exempt = min(inputs.gratuity_received, LIMITS['gratuity_old'])
     if gratuity_exempt > 0:
         exemptions['Gratuity [10(10)]'] = gratuity_exempt
 
     # Leave Encashment [10(10AA)]
-    if v.is_government_employee:
-        leave_exempt = v.leave_encashment_received  # Fully exempt for govt
+    if inputs.is_government_employee:
+        leave_exempt = inputs.leave_encashment_received  # Fully exempt for govt
     else:
-        leave_exempt = min(v.leave_encashment_received, LIMITS['leave_encashment'])
+        leave_exempt = min(inputs.leave_encashment_received, LIMITS['leave_encashment'])
     if leave_exempt > 0:
         exemptions['Leave Encashment [10(10AA)]'] = leave_exempt
 
     # Other Section 10 Exemptions
-    if v.other_section_10_exemptions > 0:
-        exemptions['Other Section 10 Exemptions'] = v.other_section_10_exemptions
+    if inputs.other_section_10_exemptions > 0:
+        exemptions['Other Section 10 Exemptions'] = inputs.other_section_10_exemptions
 
     return exemptions
 
 
-def calculate_exemptions_new_regime() -> Dict[str, float]:
+def calculate_exemptions_new_regime(inputs: Inputs = v, ctx: Optional[_Ctx] = None) -> Dict[str, float]:
     """Calculate Section 10 exemptions for New Tax Regime."""
     exemptions = {}
 
     # Transport Allowance for Disabled [10(14)] - Allowed in New Regime
-    if v.is_disabled:
+    if inputs.is_disabled:
         transport_exempt = min(
-            v.transport_allowance,
-            LIMITS['transport_disabled_monthly'] * 12
+            inputs.transport_allowance,
+            TRANSPORT_DISABLED_ANNUAL
         )
         if transport_exempt > 0:
             exemptions['Transport (Disabled) [10(14)]'] = transport_exempt
 
     # Conveyance for official duties - Allowed in New Regime
-    conveyance_exempt = min(v.conveyance_allowance, v.conveyance_actual_expenses)
+    conveyance_exempt = min(inputs.conveyance_allowance, inputs.conveyance_actual_expenses)
     if conveyance_exempt > 0:
         exemptions['Conveyance (Official) [10(14)]'] = conveyance_exempt
 
     # Gratuity Exemption [10(10)] - Rs 5 Lakh in New Regime
-    gratuity_exempt = min(v.gratuity_received, LIMITS['gratuity_new'])
+    gratuity_exempt = min(inputs.gratuity_received, LIMITS['gratuity_new'])
     if gratuity_exempt > 0:
         exemptions['Gratuity [10(10)]'] = gratuity_exempt
 
     # Leave Encashment [10(10AA)] - Still allowed
-    if v.is_government_employee:
-        leave_exempt = v.leave_encashment_received
+    if inputs.is_government_employee:
+        leave_exempt = inputs.leave_encashment_received
     else:
-        leave_exempt = min(v.leave_encashment_received, LIMITS['leave_encashment'])
+        leave_exempt = min(inputs.leave_encashment_received, LIMITS['leave_encashment'])
     if leave_exempt > 0:
         exemptions['Leave Encashment [10(10AA)]'] = leave_exempt
 
     return exemptions
 
 
-def calculate_section_16_old_regime() -> Dict[str, float]:
+def calculate_section_16_old_regime(inputs: Inputs = v, ctx: Optional[_Ctx] = None) -> Dict[str, float]:
     """Calculate Section 16 deductions for Old Tax Regime."""
     deductions = {}
 
@@ -346,15 +413,15 @@ def calculate_section_16_old_regime() -> Dict[str, float]:
     deductions['Standard Deduction [16(ia)]'] = LIMITS['standard_deduction_old']
 
     # Professional Tax [16(iii)]
-    if v.professional_tax_paid > 0:
-        deductions['Professional Tax [16(iii)]'] = min(v.professional_tax_paid, 2500)
+    if inputs.professional_tax_paid > 0:
+        deductions['Professional Tax [16(iii)]'] = min(inputs.professional_tax_paid, 2500)
 
     # Entertainment Allowance [16(ii)] - Only for Govt employees
-    if v.is_government_employee and v.entertainment_allowance > 0:
+    if inputs.is_government_employee and inputs.entertainment_allowance > 0:
         # Min of: Actual, 1/5th of Basic, Rs 5,000
         ent_deduction = min(
-            v.entertainment_allowance,
-            v.basic_salary / 5,
+            inputs.entertainment_allowance,
+            inputs.basic_salary / 5,
             5000
         )
         deductions['Entertainment Allowance [16(ii)]'] = ent_deduction
@@ -362,7 +429,7 @@ def calculate_section_16_old_regime() -> Dict[str, float]:
     return deductions
 
 
-def calculate_section_16_new_regime() -> Dict[str, float]:
+def calculate_section_16_new_regime(inputs: Inputs = v, ctx: Optional[_Ctx] = None) -> Dict[str, float]:
     """Calculate Section 16 deductions for New Tax Regime."""
     deductions = {}
 
@@ -374,17 +441,17 @@ def calculate_section_16_new_regime() -> Dict[str, float]:
     return deductions
 
 
-def calculate_income_from_house_property(regime: str) -> Tuple[float, Dict[str, float]]:
+def calculate_income_from_house_property(regime: str, inputs: Inputs = v) -> Tuple[float, Dict[str, float]]:
     """Calculate income/loss from house property."""
     details = {}
 
     # Self-Occupied Property
     self_occupied_loss = 0
-    if v.home_loan_interest_self_occupied > 0:
+    if inputs.home_loan_interest_self_occupied > 0:
         if regime == 'old':
             # Max Rs 2 Lakh deduction for self-occupied
             self_occupied_loss = min(
-                v.home_loan_interest_self_occupied,
+                inputs.home_loan_interest_self_occupied,
                 LIMITS['home_loan_interest_self_occupied']
             )
             details['Self-Occupied Interest [24(b)]'] = -self_occupied_loss
@@ -392,10 +459,10 @@ def calculate_income_from_house_property(regime: str) -> Tuple[float, Dict[str,
 
     # Let-Out Property
     let_out_income = 0
-    if v.rental_income_annual > 0:
-        gross_rent = v.rental_income_annual
+    if inputs.rental_income_annual > 0:
+        gross_rent = inputs.rental_income_annual
         standard_deduction = gross_rent * 0.30  # 30% standard deduction
-        interest_deduction = v.home_loan_interest_let_out  # No limit for let-out
+        interest_deduction = inputs.home_loan_interest_let_out  # No limit for let-out
 
         let_out_income = gross_rent - standard_deduction - interest_deduction
 
@@ -405,8 +472,8 @@ def calculate_income_from_house_property(regime: str) -> Tuple[float, Dict[str,
             details['Let-Out Interest [24(b)]'] = -interest_deduction
 
     # Pre-construction interest (1/5th per year for 5 years)
-    if v.construction_completed and v.pre_construction_interest > 0:
-        pre_construction_yearly = v.pre_construction_interest / 5
+    if inputs.construction_completed and inputs.pre_construction_interest > 0:
+        pre_construction_yearly = inputs.pre_construction_interest / 5
         if regime == 'old':
             details['Pre-construction Interest'] = -pre_construction_yearly
             self_occupied_loss += pre_construction_yearly
@@ -421,53 +488,54 @@ def calculate_income_from_house_property(regime: str) -> Tuple[float, Dict[str,
     return total_house_property, details
 
 
-def calculate_chapter_via_old_regime() -> Dict[str, float]:
+def calculate_chapter_via_old_regime(inputs: Inputs = v, ctx: Optional[_Ctx] = None) -> Dict[str, float]:
     """Calculate Chapter VI-A deductions for Old Tax Regime."""
+    if ctx is None:
+        ctx = _context(inputs)
     deductions = {}
 
     # Section 80C (Combined limit Rs 1,50,000)
+    limit_80c = LIMITS['80c_limit']
     total_80c = (
-        v.epf_contribution_employee +
-        v.ppf_contribution +
-        v.life_insurance_premium +
-        v.elss_investment +
-        v.nsc_investment +
-        v.sukanya_samriddhi +
-        v.tax_saver_fd +
-        v.tuition_fees +
-        v.home_loan_principal +
-        v.scss_investment +
-        v.other_80c +
-        v.pension_fund_contribution +
-        min(v.employee_nps_contribution, LIMITS['80c_limit'])  # 80CCD(1) within 80C
+        inputs.epf_contribution_employee +
+        inputs.ppf_contribution +
+        inputs.life_insurance_premium +
+        inputs.elss_investment +
+        inputs.nsc_investment +
+        inputs.sukanya_samriddhi +
+        inputs.tax_saver_fd +
+        inputs.tuition_fees +
+        inputs.home_loan_principal +
+        inputs.scss_investment +
+        inputs.other_80c +
+        inputs.pension_fund_contribution +
+        min(inputs.employee_nps_contribution, limit_80c)  # 80CCD(1) within 80C
     )
-    deduction_80c = min(total_80c, LIMITS['80c_limit'])
+    deduction_80c = min(total_80c, limit_80c)
     if deduction_80c > 0:
         deductions['Section 80C'] = deduction_80c
 
     # Section 80CCD(1B) - Additional NPS
-    deduction_80ccd_1b = min(v.additional_nps_contribution, LIMITS['80ccd_1b_limit'])
+    deduction_80ccd_1b = min(inputs.additional_nps_contribution, LIMITS['80ccd_1b_limit'])
     if deduction_80ccd_1b > 0:
         deductions['Section 80CCD(1B) - Add. NPS'] = deduction_80ccd_1b
 
     # Section 80CCD(2) - Employer NPS (up to 14% of Basic+DA)
-    basic_plus_da = v.basic_salary + v.dearness_allowance
-    max_employer_nps = basic_plus_da * LIMITS['80ccd_2_percent']
-    deduction_80ccd_2 = min(v.employer_nps_contribution, max_employer_nps)
+    deduction_80ccd_2 = min(inputs.employer_nps_contribution, ctx.max_employer_nps)
     if deduction_80ccd_2 > 0:
         deductions['Section 80CCD(2) - Employer NPS'] = deduction_80ccd_2
 
     # Section 80D - Health Insurance
     # Self, spouse, children
-    self_limit = LIMITS['80d_self_senior'] if v.age_category != 'below_60' else LIMITS['80d_self_normal']
-    deduction_80d_self = min(v.health_insurance_self, self_limit)
+    self_limit = LIMITS['80d_self_senior'] if inputs.age_category != 'below_60' else LIMITS['80d_self_normal']
+    deduction_80d_self = min(inputs.health_insurance_self, self_limit)
 
     # Parents
-    parents_limit = LIMITS['80d_parents_senior'] if v.parents_are_senior_citizen else LIMITS['80d_parents_normal']
-    deduction_80d_parents = min(v.health_insurance_parents, parents_limit)
+    parents_limit = LIMITS['80d_parents_senior'] if inputs.parents_are_senior_citizen else LIMITS['80d_parents_normal']
+    deduction_80d_parents = min(inputs.health_insurance_parents, parents_limit)
 
     # Preventive health checkup (within above limits)
-    preventive = min(v.preventive_health_checkup, LIMITS['80d_preventive'])
+    preventive = min(inputs.preventive_health_checkup, LIMITS['80d_preventive'])
 
     total_80d = deduction_80d_self + deduction_80d_parents
     # Preventive is included in the limits, not additional
@@ -475,54 +543,54 @@ def calculate_chapter_via_old_regime() -> Dict[str, float]:
         deductions['Section 80D - Health Insurance'] = total_80d
 
     # Section 80DD - Disabled Dependent
-    if v.disabled_dependent_expenses > 0:
-        if v.is_severe_disability:
+    if inputs.disabled_dependent_expenses > 0:
+        if inputs.is_severe_disability:
             deductions['Section 80DD - Disabled Dependent'] = LIMITS['80dd_severe']
         else:
             deductions['Section 80DD - Disabled Dependent'] = LIMITS['80dd_normal']
 
     # Section 80DDB - Medical Treatment
-    if v.medical_treatment_expenses > 0:
-        limit = LIMITS['80ddb_senior'] if v.age_category != 'below_60' else LIMITS['80ddb_normal']
-        deductions['Section 80DDB - Medical Treatment'] = min(v.medical_treatment_expenses, limit)
+    if inputs.medical_treatment_expenses > 0:
+        limit = LIMITS['80ddb_senior'] if inputs.age_category != 'below_60' else LIMITS['80ddb_normal']
+        deductions['Section 80DDB - Medical Treatment'] = min(inputs.medical_treatment_expenses, limit)
 
     # Section 80E - Education Loan Interest (No limit)
-    if v.education_loan_interest > 0:
-        deductions['Section 80E - Education Loan'] = v.education_loan_interest
+    if inputs.education_loan_interest > 0:
+        deductions['Section 80E - Education Loan'] = inputs.education_loan_interest
 
     # Section 80EE - Home Loan Interest
-    if v.home_loan_interest_80ee > 0:
-        deductions['Section 80EE - Home Loan'] = min(v.home_loan_interest_80ee, LIMITS['80ee_limit'])
+    if inputs.home_loan_interest_80ee > 0:
+        deductions['Section 80EE - Home Loan'] = min(inputs.home_loan_interest_80ee, LIMITS['80ee_limit'])
 
     # Section 80EEA - Additional Home Loan Interest
-    if v.home_loan_interest_80eea > 0:
-        deductions['Section 80EEA - Add. Home Loan'] = min(v.home_loan_interest_80eea, LIMITS['80eea_limit'])
+    if inputs.home_loan_interest_80eea > 0:
+        deductions['Section 80EEA - Add. Home Loan'] = min(inputs.home_loan_interest_80eea, LIMITS['80eea_limit'])
 
     # Section 80EEB - EV Loan Interest
-    if v.ev_loan_interest > 0:
-        deductions['Section 80EEB - EV Loan'] = min(v.ev_loan_interest, LIMITS['80eeb_limit'])
+    if inputs.ev_loan_interest > 0:
+        deductions['Section 80EEB - EV Loan'] = min(inputs.ev_loan_interest, LIMITS['80eeb_limit'])
 
     # Section 80G - Donations
-    if v.donations_100_percent > 0:
-        deductions['Section 80G - Donations (100%)'] = v.donations_100_percent
-    if v.donations_50_percent > 0:
-        deductions['Section 80G - Donations (50%)'] = v.donations_50_percent * 0.5
+    if inputs.donations_100_percent > 0:
+        deductions['Section 80G - Donations (100%)'] = inputs.donations_100_percent
+    if inputs.donations_50_percent > 0:
+        deductions['Section 80G - Donations (50%)'] = inputs.donations_50_percent * 0.5
 
     # Section 80GG - Rent Paid (if not receiving HRA)
-    if v.rent_paid_no_hra > 0 and v.hra_received == 0:
-        deductions['Section 80GG - Rent'] = min(v.rent_paid_no_hra, LIMITS['80gg_monthly'] * 12)
+    if inputs.rent_paid_no_hra > 0 and inputs.hra_received == 0:
+        deductions['Section 80GG - Rent'] = min(inputs.rent_paid_no_hra, RENT_80GG_ANNUAL)
 
     # Section 80TTA - Savings Interest (Non-senior citizens)
-    if v.age_category == 'below_60' and v.savings_account_interest > 0:
-        deductions['Section 80TTA - Savings Interest'] = min(v.savings_account_interest, LIMITS['80tta_limit'])
+    if inputs.age_category == 'below_60' and inputs.savings_account_interest > 0:
+        deductions['Section 80TTA - Savings Interest'] = min(inputs.savings_account_interest, LIMITS['80tta_limit'])
 
     # Section 80TTB - Interest Income (Senior citizens only)
-    if v.age_category != 'below_60' and v.senior_citizen_interest_income > 0:
-        deductions['Section 80TTB - Interest Income'] = min(v.senior_citizen_interest_income, LIMITS['80ttb_limit'])
+    if inputs.age_category != 'below_60' and inputs.senior_citizen_interest_income > 0:
+        deductions['Section 80TTB - Interest Income'] = min(inputs.senior_citizen_interest_income, LIMITS['80ttb_limit'])
 
     # Section 80U - Self Disability
-    if v.self_disability_claim:
-        if v.self_severe_disability:
+    if inputs.self_disability_claim:
+        if inputs.self_severe_disability:
             deductions['Section 80U - Self Disability'] = LIMITS['80u_severe']
         else:
             deductions['Section 80U - Self Disability'] = LIMITS['80u_normal']
@@ -530,89 +598,125 @@ def calculate_chapter_via_old_regime() -> Dict[str, float]:
     return deductions
 
 
-def calculate_chapter_via_new_regime() -> Dict[str, float]:
+def calculate_chapter_via_new_regime(inputs: Inputs = v, ctx: Optional[_Ctx] = None) -> Dict[str, float]:
     """Calculate Chapter VI-A deductions for New Tax Regime."""
+    if ctx is None:
+        ctx = _context(inputs)
     deductions = {}
 
     # Only 80CCD(2) - Employer NPS is allowed in New Regime
-    basic_plus_da = v.basic_salary + v.dearness_allowance
-    max_employer_nps = basic_plus_da * LIMITS['80ccd_2_percent']
-    deduction_80ccd_2 = min(v.employer_nps_contribution, max_employer_nps)
+    deduction_80ccd_2 = min(inputs.employer_nps_contribution, ctx.max_employer_nps)
     if deduction_80ccd_2 > 0:
         deductions['Section 80CCD(2) - Employer NPS'] = deduction_80ccd_2
 
     return deductions
 
 
-def calculate_tax_on_income(taxable_income: float, regime: str) -> float:
-    """Calculate tax based on slabs."""
-    if taxable_income <= 0:
-        return 0
-
-    if regime == 'new':
-        slabs = NEW_REGIME_SLABS
-    else:
-        if v.age_category == 'super_senior':
-            slabs = OLD_REGIME_SLABS_SUPER_SENIOR
-        elif v.age_category == 'senior':
-            slabs = OLD_REGIME_SLABS_SENIOR
-        else:
-            slabs = OLD_REGIME_SLABS_BELOW_60
-
+def slab_tax(income: float, slabs: List[Tuple[float, float]]) -> float:
+    """Apply progressive (limit, rate) slabs to an income; income above the top limit is untaxed."""
     tax = 0
     previous_limit = 0
 
     for limit, rate in slabs:
-        if taxable_income <= previous_limit:
+        if income <= previous_limit:
             break
 
-        taxable_in_slab = min(taxable_income, limit) - previous_limit
-        tax += taxable_in_slab * rate
+        tax += (min(income, limit) - previous_limit) * rate
         previous_limit = limit
 
     return tax
 
 
-def calculate_rebate_87a(taxable_income: float, tax: float, regime: str) -> float:
-    """Calculate rebate under Section 87A."""
-    if regime == 'new':
-        if taxable_income <= LIMITS['rebate_87a_new_limit']:
-            return min(tax, LIMITS['rebate_87a_new_amount'])
-    else:
-        if taxable_income <= LIMITS['rebate_87a_old_limit']:
-            return min(tax, LIMITS['rebate_87a_old_amount'])
+def _cumulative_slabs(slabs: List[Tuple[float, float]]) -> Tuple[tuple, tuple, tuple, tuple]:
+    """Split slabs into limits, lower bounds, rates and tax due below each slab."""
+    if not slabs or slabs[-1][0] != float('inf'):
+        raise ValueError("Slab table needs a top slab with limit float('inf')")
+    limits, lowers, rates, bases = [], [], [], []
+    tax = 0
+    previous_limit = 0
+    for limit, rate in slabs:
+        limits.append(limit)
+        lowers.append(previous_limit)
+        rates.append(rate)
+        bases.append(tax)
+        tax += (limit - previous_limit) * rate
+        previous_limit = limit
+    return tuple(limits), tuple(lowers), tuple(rates), tuple(bases)
+
+
+def _table_tax(income: float, table: Tuple[tuple, tuple, tuple, tuple]) -> float:
+    """Closed-form slab tax: tax below the income's slab plus its marginal part."""
+    limits, lowers, rates, bases = table
+    i = bisect_left(limits, income)
+    return bases[i] + (income - lowers[i]) * rates[i]
+
+
+# Cumulative slab tables, built once for the closed-form slab tax
+NEW_REGIME_TABLE = _cumulative_slabs(NEW_REGIME_SLABS)
+OLD_REGIME_TABLE_BELOW_60 = _cumulative_slabs(OLD_REGIME_SLABS_BELOW_60)
+OLD_REGIME_TABLE_SENIOR = _cumulative_slabs(OLD_REGIME_SLABS_SENIOR)
+OLD_REGIME_TABLE_SUPER_SENIOR = _cumulative_slabs(OLD_REGIME_SLABS_SUPER_SENIOR)
+
+# Slab table per (regime, age_category); other age categories use the below-60 slabs
+SLAB_TABLE = {
+    ('new', 'below_60'): NEW_REGIME_TABLE,
+    ('new', 'senior'): NEW_REGIME_TABLE,
+    ('new', 'super_senior'): NEW_REGIME_TABLE,
+    ('old', 'below_60'): OLD_REGIME_TABLE_BELOW_60,
+    ('old', 'senior'): OLD_REGIME_TABLE_SENIOR,
+    ('old', 'super_senior'): OLD_REGIME_TABLE_SUPER_SENIOR,
+}
+
+
+def slab_tax_batch(incomes: Iterable[float], slabs: List[Tuple[float, float]]) -> List[float]:
+    """Apply progressive slabs to many incomes, e.g. for what-if salary sweeps."""
+    # The closed form needs an open-ended top slab; slabs with a finite top
+    # leave income above it untaxed, which slab_tax handles
+    if not slabs or slabs[-1][0] != float('inf'):
+        return [slab_tax(income, slabs) for income in incomes]
+
+    # Tax below each slab is computed once, so each income needs only a
+    # binary search for its slab plus one multiply
+    table = _cumulative_slabs(slabs)
+    return [_table_tax(income, table) if income > 0 else 0 for income in incomes]
+
+
+def _tax_regime(regime: str) -> str:
+    """Key into the per-regime tax tables; any regime other than 'new' is taxed as old."""
+    return 'new' if regime == 'new' else 'old'
+
+
+def _slab_table(regime: str, age_category: str) -> Tuple[tuple, tuple, tuple, tuple]:
+    """Cumulative slab table for a regime and age category."""
+    table = SLAB_TABLE.get((_tax_regime(regime), age_category))
+    if table is None:
+        table = NEW_REGIME_TABLE if regime == 'new' else OLD_REGIME_TABLE_BELOW_60
+    return table
+
+
+def _income_tax(taxable_income: float, table: Tuple[tuple, tuple, tuple, tuple]) -> float:
+    """Slab tax on a taxable income from a cumulative slab table."""
+    if taxable_income <= 0:
+        return 0
+    return _table_tax(taxable_income, table)
+
+
+def _rebate_87a(taxable_income: float, tax: float, rebate: Tuple[float, float]) -> float:
+    """Section 87A rebate from a regime's (income limit, maximum rebate)."""
+    income_limit, max_rebate = rebate
+    if taxable_income <= income_limit:
+        return min(tax, max_rebate)
     return 0
 
 
-def calculate_surcharge(taxable_income: float, tax: float, regime: str) -> float:
-    """Calculate surcharge based on income level."""
+def _surcharge(taxable_income: float, tax: float, surcharge_table: Tuple[tuple, tuple]) -> float:
+    """Surcharge from a regime's (thresholds, rates) table."""
     if taxable_income <= LIMITS['surcharge_50l']:
         return 0
 
-    if regime == 'new':
-        # New regime: Max surcharge 25%
-        if taxable_income > LIMITS['surcharge_2cr']:
-            rate = 0.25
-        elif taxable_income > LIMITS['surcharge_1cr']:
-            rate = 0.15
-        elif taxable_income > LIMITS['surcharge_50l']:
-            rate = 0.10
-        else:
-            rate = 0
-    else:
-        # Old regime: Max surcharge 37%
-        if taxable_income > LIMITS['surcharge_5cr']:
-            rate = 0.37
-        elif taxable_income > LIMITS['surcharge_2cr']:
-            rate = 0.25
-        elif taxable_income > LIMITS['surcharge_1cr']:
-            rate = 0.15
-        elif taxable_income > LIMITS['surcharge_50l']:
-            rate = 0.10
-        else:
-            rate = 0
-
-    surcharge = tax * rate
+    # Rate of the highest threshold the income exceeds
+    thresholds, rates = surcharge_table
+    surcharge = tax * rates[bisect_left(thresholds, taxable_income)]
 
     # Marginal relief calculation (simplified)
     # TODO: Implement full marginal relief logic
@@ -620,89 +724,195 @@ def calculate_surcharge(taxable_income: float, tax: float, regime: str) -> float
     return surcharge
 
 
-def calculate_tax(regime: str) -> TaxBreakdown:
+def calculate_tax_on_income(taxable_income: float, regime: str, inputs: Inputs = v) -> float:
+    """Calculate tax based on slabs."""
+    return _income_tax(taxable_income, _slab_table(regime, inputs.age_category))
+
+
+def calculate_rebate_87a(taxable_income: float, tax: float, regime: str) -> float:
+    """Calculate rebate under Section 87A."""
+    return _rebate_87a(taxable_income, tax, REBATE_87A[_tax_regime(regime)])
+
+
+def calculate_surcharge(taxable_income: float, tax: float, regime: str) -> float:
+    """Calculate surcharge based on income level."""
+    return _surcharge(taxable_income, tax, SURCHARGE_TABLE[_tax_regime(regime)])
+
+
+def calculate_liability(taxable_income: float, regime: str, age_category: str) -> Tuple[float, float, float, float, float, float]:
+    """Slab tax, 87A rebate, tax after rebate, surcharge, cess and total tax in one pass."""
+    return _liability(
+        taxable_income, _slab_table(regime, age_category), REBATE_87A[_tax_regime(regime)], SURCHARGE_TABLE[_tax_regime(regime)]
+    )
+
+
+def _liability(taxable_income: float, table: tuple, rebate: tuple, surcharge_table: tuple) -> Tuple[float, float, float, float, float, float]:
+    """calculate_liability with the regime's tables already looked up."""
+    tax_on_income = _income_tax(taxable_income, table)
+    rebate_87a = _rebate_87a(taxable_income, tax_on_income, rebate)
+    tax_after_rebate = max(0, tax_on_income - rebate_87a)
+    surcharge = _surcharge(taxable_income, tax_after_rebate, surcharge_table)
+    cess = (tax_after_rebate + surcharge) * LIMITS['cess_rate']
+    total_tax = tax_after_rebate + surcharge + cess
+    return tax_on_income, rebate_87a, tax_after_rebate, surcharge, cess, total_tax
+
+
+def calculate_tax(regime: str, inputs: Inputs = v, ctx: Optional[_Ctx] = None) -> TaxBreakdown:
     """Calculate complete tax for a given regime."""
-    breakdown = TaxBreakdown(regime=regime)
+    return make_tax_fn(regime, inputs.age_category)(inputs, ctx)
 
-    # Step 1: Calculate Gross Salary
-    breakdown.gross_salary = calculate_gross_salary()
 
-    # Step 2: Calculate Exemptions
+@lru_cache(maxsize=6)
+def make_tax_fn(regime: str, age_category: str) -> Callable[..., TaxBreakdown]:
+    """Build calculate_tax specialized to one regime and age category."""
+    # The per-regime helpers share an (inputs, ctx) signature, so picking
+    # them and the tax tables here leaves no regime or age branch per call
     if regime == 'old':
-        breakdown.exemptions = calculate_exemptions_old_regime()
+        exemptions_fn = calculate_exemptions_old_regime
+        section_16_fn = calculate_section_16_old_regime
+        chapter_via_fn = calculate_chapter_via_old_regime
     else:
-        breakdown.exemptions = calculate_exemptions_new_regime()
-    breakdown.total_exemptions = sum(breakdown.exemptions.values())
+        exemptions_fn = calculate_exemptions_new_regime
+        section_16_fn = calculate_section_16_new_regime
+        chapter_via_fn = calculate_chapter_via_new_regime
+    table = _slab_table(regime, age_category)
+    rebate = REBATE_87A[_tax_regime(regime)]
+    surcharge_table = SURCHARGE_TABLE[_tax_regime(regime)]
 
-    # Step 3: Income from Salary (after exemptions)
-    breakdown.income_from_salary = breakdown.gross_salary - breakdown.total_exemptions
+    def tax_fn(inputs: Inputs = v, ctx: Optional[_Ctx] = None) -> TaxBreakdown:
+        if ctx is None:
+            ctx = _context(inputs)
 
-    # Step 4: Section 16 Deductions
-    if regime == 'old':
-        breakdown.section_16_deductions = calculate_section_16_old_regime()
-    else:
-        breakdown.section_16_deductions = calculate_section_16_new_regime()
-    breakdown.total_section_16 = sum(breakdown.section_16_deductions.values())
+        # Step 1: Gross Salary (shared by both regimes)
+        gross_salary = ctx.gross_salary
 
-    # Step 5: Net Salary Income
-    breakdown.net_salary_income = max(0, breakdown.income_from_salary - breakdown.total_section_16)
+        # Step 2: Calculate Exemptions
+        exemptions = exemptions_fn(inputs, ctx)
+        total_exemptions = sum(exemptions.values())
 
-    # Step 6: Income from House Property
-    breakdown.income_from_house_property, _ = calculate_income_from_house_property(regime)
+        # Step 3: Income from Salary (after exemptions)
+        income_from_salary = gross_salary - total_exemptions
 
-    # Step 7: Other Income
-    breakdown.other_income = v.interest_income_other + v.other_income + v.savings_account_interest
+        # Step 4: Section 16 Deductions
+        section_16_deductions = section_16_fn(inputs, ctx)
+        total_section_16 = sum(section_16_deductions.values())
 
-    # Step 8: Gross Total Income
-    breakdown.gross_total_income = (
-        breakdown.net_salary_income +
-        breakdown.income_from_house_property +
-        breakdown.other_income
-    )
+        # Step 5: Net Salary Income
+        net_salary_income = max(0, income_from_salary - total_section_16)
 
-    # Step 9: Chapter VI-A Deductions
-    if regime == 'old':
-        breakdown.chapter_via_deductions = calculate_chapter_via_old_regime()
-    else:
-        breakdown.chapter_via_deductions = calculate_chapter_via_new_regime()
-    breakdown.total_chapter_via = sum(breakdown.chapter_via_deductions.values())
+        # Step 6: Income from House Property
+        income_from_house_property, _ = calculate_income_from_house_property(regime, inputs)
 
-    # Step 10: Taxable Income
-    breakdown.taxable_income = max(0, breakdown.gross_total_income - breakdown.total_chapter_via)
+        # Step 7: Other Income (shared by both regimes)
+        other_income = ctx.other_income
 
-    # Step 11: Tax Calculation
-    breakdown.tax_on_income = calculate_tax_on_income(breakdown.taxable_income, regime)
+        # Step 8: Gross Total Income
+        gross_total_income = (
+            net_salary_income +
+            income_from_house_property +
+            other_income
+        )
 
-    # Step 12: Rebate under 87A
-    breakdown.rebate_87a = calculate_rebate_87a(
-        breakdown.taxable_income,
-        breakdown.tax_on_income,
-        regime
-    )
-    breakdown.tax_after_rebate = max(0, breakdown.tax_on_income - breakdown.rebate_87a)
+        # Step 9: Chapter VI-A Deductions
+        chapter_via_deductions = chapter_via_fn(inputs, ctx)
+        total_chapter_via = sum(chapter_via_deductions.values())
 
-    # Step 13: Surcharge
-    breakdown.surcharge = calculate_surcharge(
-        breakdown.taxable_income,
-        breakdown.tax_after_rebate,
-        regime
-    )
+        # Step 10: Taxable Income
+        taxable_income = max(0, gross_total_income - total_chapter_via)
 
-    # Step 14: Health & Education Cess (4%)
-    breakdown.cess = (breakdown.tax_after_rebate + breakdown.surcharge) * LIMITS['cess_rate']
+        # Steps 11-15: Slab tax, 87A rebate, surcharge, Health & Education Cess (4%)
+        tax_on_income, rebate_87a, tax_after_rebate, surcharge, cess, total_tax = (
+            _liability(taxable_income, table, rebate, surcharge_table)
+        )
 
-    # Step 15: Total Tax
-    breakdown.total_tax = breakdown.tax_after_rebate + breakdown.surcharge + breakdown.cess
+        # Step 16: Effective Tax Rate
+        effective_tax_rate = 0
+        if gross_salary > 0:
+            effective_tax_rate = (total_tax / gross_salary) * 100
+
+        return TaxBreakdown(
+            regime=regime,
+            gross_salary=gross_salary,
+            exemptions=exemptions,
+            total_exemptions=total_exemptions,
+            income_from_salary=income_from_salary,
+            section_16_deductions=section_16_deductions,
+            total_section_16=total_section_16,
+            net_salary_income=net_salary_income,
+            income_from_house_property=income_from_house_property,
+            other_income=other_income,
+            gross_total_income=gross_total_income,
+            chapter_via_deductions=chapter_via_deductions,
+            total_chapter_via=total_chapter_via,
+            taxable_income=taxable_income,
+            tax_on_income=tax_on_income,
+            rebate_87a=rebate_87a,
+            tax_after_rebate=tax_after_rebate,
+            surcharge=surcharge,
+            cess=cess,
+            total_tax=total_tax,
+            effective_tax_rate=effective_tax_rate,
+        )
 
-    # Step 16: Effective Tax Rate
-    if breakdown.gross_salary > 0:
-        breakdown.effective_tax_rate = (breakdown.total_tax / breakdown.gross_salary) * 100
+    return tax_fn
 
-    return breakdown
 
+# Names of every input read from the variables module
+_INPUT_NAMES = tuple(v.__annotations__)
+_INPUT_FIELDS = frozenset(_INPUT_NAMES)
 
-def compare_regimes() -> Tuple[TaxBreakdown, TaxBreakdown]:
-    """Calculate and compare tax under both regimes."""
-    old_regime = calculate_tax('old')
-    new_regime = calculate_tax('new')
+
+def _compare(inputs: Inputs) -> Tuple[TaxBreakdown, TaxBreakdown]:
+    """Calculate both regimes, sharing the regime-independent steps."""
+    ctx = _context(inputs)
+    old_regime = calculate_tax('old', inputs, ctx)
+    new_regime = calculate_tax('new', inputs, ctx)
     return old_regime, new_regime
+
+
+def _read_only(breakdown: TaxBreakdown) -> TaxBreakdown:
+    """Breakdown whose line items are read-only views, safe to share from the cache."""
+    return replace(
+        breakdown,
+        exemptions=MappingProxyType(breakdown.exemptions),
+        section_16_deductions=MappingProxyType(breakdown.section_16_deductions),
+        chapter_via_deductions=MappingProxyType(breakdown.chapter_via_deductions),
+    )
+
+
+@lru_cache(maxsize=64)
+def _compare_regimes_cached(values: tuple) -> Tuple[TaxBreakdown, TaxBreakdown]:
+    """Calculate both regimes for input values in TaxInputs field order."""
+    # Every caller with these inputs gets the same objects, so the
+    # line-item dicts are frozen into read-only views once, on a miss
+    old_regime, new_regime = _compare(v.TaxInputs(*values))
+    return _read_only(old_regime), _read_only(new_regime)
+
+
+def compare_regimes() -> Tuple[TaxBreakdown, TaxBreakdown]:
+    """Calculate and compare tax under both regimes; line items are read-only."""
+    # A plain tuple of the module values is a much cheaper cache key than
+    # a TaxInputs record, which is only built on a miss
+    values = vars(v)
+    return _compare_regimes_cached(tuple([values[name] for name in _INPUT_NAMES]))
+
+
+def compare_regimes_many(records: Iterable[v.TaxInputs]) -> List[Tuple[TaxBreakdown, TaxBreakdown]]:
+    """Compare both regimes for each TaxInputs record, e.g. from variables.load_inputs
+    (which takes .env-style keys such as BASIC_SALARY)."""
+    # Per-employee records rarely repeat, so this skips the memo cache
+    return [_compare(inputs) for inputs in records]
+
+
+def _with_overrides(base: v.TaxInputs, overrides: Dict[str, object]) -> v.TaxInputs:
+    unknown = overrides.keys() - _INPUT_FIELDS
+    if unknown:
+        raise ValueError(f"Unknown inputs: {', '.join(sorted(unknown))}")
+    return replace(base, **overrides)
+
+
+def compare_regimes_batch(scenarios: Iterable[Dict[str, object]]) -> List[Tuple[TaxBreakdown, TaxBreakdown]]:
+    """Compare both regimes for each scenario of overrides to the current inputs, e.g. a
+    salary sweep. Keys are variable names such as basic_salary, not .env keys."""
+    base = v.current_inputs()
+    return compare_regimes_many(_with_overrides(base, overrides) for overrides in scenarios)
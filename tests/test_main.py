@@ -0,0 +1,25 @@
+"""Tests for the CLI report."""
+
+import contextlib
+import io
+
+import main
+import variables
+
+
+def _run_main() -> str:
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout):
+        main.main()
+    return stdout.getvalue()
+
+
+def test_main_writes_help_to_redirected_stdout():
+    assert 'No salary data found!' in _run_main()
+
+
+def test_main_writes_report_to_redirected_stdout(monkeypatch):
+    monkeypatch.setattr(variables, 'basic_salary', 1500000.0)
+    report = _run_main()
+    assert 'INDIA TAX REGIME COMPARISON' in report
+    assert 'Gross Salary                                ₹1,500,000    ₹1,500,000' in report
@@ -0,0 +1,144 @@
+"""Tests for the tax calculation pipeline."""
+
+from dataclasses import replace
+
+import pytest
+
+import variables
+from tax_calculator import (
+    NEW_REGIME_SLABS,
+    _cumulative_slabs,
+    calculate_exemptions_old_regime,
+    calculate_hra_exemption,
+    calculate_liability,
+    calculate_rebate_87a,
+    calculate_surcharge,
+    calculate_tax_on_income,
+    compare_regimes,
+    compare_regimes_batch,
+    compare_regimes_many,
+    slab_tax,
+    slab_tax_batch,
+)
+
+
+def test_slab_tax_batch_matches_slab_tax():
+    incomes = [-1, 0, 400000, 400001, 1234567.89, 2400000, 5e7]
+    assert slab_tax_batch(incomes, NEW_REGIME_SLABS) == [
+        slab_tax(income, NEW_REGIME_SLABS) for income in incomes
+    ]
+
+
+def test_slab_tax_batch_finite_top_slab():
+    slabs = [(500000, 0.0), (1000000, 0.1)]
+    assert slab_tax_batch([2_000_000, 750000, 0], slabs) == [50000.0, 25000.0, 0]
+    assert slab_tax_batch([2_000_000], []) == [0]
+
+
+def test_cumulative_slabs_rejects_finite_top_slab():
+    with pytest.raises(ValueError):
+        _cumulative_slabs([(500000, 0.0), (1000000, 0.1)])
+
+
+@pytest.mark.parametrize('regime, age_category, taxable_income, expected', [
+    # (tax on income, 87A rebate, tax after rebate, surcharge, cess, total tax)
+    ('new', 'below_60', 1200000, (60000, 60000, 0, 0, 0, 0)),
+    ('new', 'below_60', 1275000, (71250, 0, 71250, 0, 2850, 74100)),
+    ('new', 'below_60', 5000000, (1080000, 0, 1080000, 0, 43200, 1123200)),
+    ('old', 'below_60', 500000, (12500, 12500, 0, 0, 0, 0)),
+    ('old', 'below_60', 1000000, (112500, 0, 112500, 0, 4500, 117000)),
+    ('old', 'senior', 1000000, (110000, 0, 110000, 0, 4400, 114400)),
+    ('old', 'super_senior', 1000000, (100000, 0, 100000, 0, 4000, 104000)),
+    ('old', 'below_60', 6000000, (1612500, 0, 1612500, 161250, 70950, 1844700)),
+])
+def test_liability_known_amounts(regime, age_category, taxable_income, expected):
+    assert calculate_liability(taxable_income, regime, age_category) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('regime, taxable_income, rate', [
+    ('old', 5000000, 0),
+    ('old', 5000001, 0.10),
+    ('old', 10000000, 0.10),
+    ('old', 10000001, 0.15),
+    ('old', 20000000, 0.15),
+    ('old', 20000001, 0.25),
+    ('old', 50000000, 0.25),
+    ('old', 50000001, 0.37),
+    ('new', 5000000, 0),
+    ('new', 5000001, 0.10),
+    ('new', 10000001, 0.15),
+    ('new', 20000001, 0.25),
+    ('new', 50000001, 0.25),
+])
+def test_surcharge_boundaries(regime, taxable_income, rate):
+    assert calculate_surcharge(taxable_income, 1000000, regime) == pytest.approx(1000000 * rate)
+
+
+@pytest.mark.parametrize('city_type, expected', [('metro', 240000.0), ('non_metro', 200000.0)])
+def test_hra_exemption_matches_old_regime_exemptions(city_type, expected):
+    inputs = replace(
+        variables.current_inputs(),
+        basic_salary=500000.0,
+        dearness_allowance=0.0,
+        hra_received=300000.0,
+        rent_paid_annual=290000.0,
+        city_type=city_type,
+    )
+    assert calculate_hra_exemption(inputs) == expected
+    assert calculate_exemptions_old_regime(inputs)['HRA Exemption [10(13A)]'] == expected
+
+
+def test_load_inputs_parses_env_style_rows():
+    records = variables.load_inputs([{'BASIC_SALARY': '1200000', 'IS_DISABLED': 'true', 'CITY_TYPE': ''}])
+    assert records[0].basic_salary == 1200000.0
+    assert records[0].is_disabled is True
+    assert records[0].city_type == 'non_metro'
+
+
+def test_load_inputs_rejects_unknown_columns():
+    with pytest.raises(ValueError, match='Unknown inputs: basic_salary'):
+        variables.load_inputs([{'basic_salary': '1200000'}])
+
+
+def test_compare_regimes_many_matches_compare_regimes(monkeypatch):
+    records = variables.load_inputs([{'BASIC_SALARY': '1200000'}, {'BASIC_SALARY': '2400000'}])
+    results = compare_regimes_many(records)
+    assert len(results) == 2
+    for record, result in zip(records, results):
+        for name in variables.__annotations__:
+            monkeypatch.setattr(variables, name, getattr(record, name))
+        assert result == compare_regimes()
+
+
+def test_compare_regimes_batch_overrides_current_inputs(monkeypatch):
+    monkeypatch.setattr(variables, 'life_insurance_premium', 50000.0)
+    results = compare_regimes_batch([{'basic_salary': 1200000.0}, {'basic_salary': 2400000.0}])
+    for basic_salary, result in zip((1200000.0, 2400000.0), results):
+        monkeypatch.setattr(variables, 'basic_salary', basic_salary)
+        assert result == compare_regimes()
+
+
+def test_compare_regimes_batch_rejects_env_keys():
+    with pytest.raises(ValueError, match='Unknown inputs: BASIC_SALARY'):
+        compare_regimes_batch([{'BASIC_SALARY': 1200000.0}])
+
+
+def test_compare_regimes_cached_line_items_are_read_only(monkeypatch):
+    monkeypatch.setattr(variables, 'basic_salary', 1200000.0)
+    monkeypatch.setattr(variables, 'life_insurance_premium', 50000.0)
+    old_regime, _ = compare_regimes()
+    with pytest.raises(TypeError):
+        old_regime.chapter_via_deductions['Injected'] = 1
+
+    old_again, _ = compare_regimes()
+    assert old_again.chapter_via_deductions == {'Section 80C': 50000.0}
+
+
+def test_rebate_and_surcharge_treat_unknown_regime_as_old():
+    assert calculate_rebate_87a(400000, 10000, 'OLD') == calculate_rebate_87a(400000, 10000, 'old')
+    assert calculate_surcharge(6e7, 1e7, 'OLD') == calculate_surcharge(6e7, 1e7, 'old')
+
+
+    senior = replace(variables.current_inputs(), age_category='senior')
+    assert calculate_tax_on_income(400000, 'OLD', senior) == 5000
+    assert calculate_tax_on_income(400000, 'old', senior) == 5000
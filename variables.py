@@ -3,115 +3,97 @@ India Tax Regime Comparison System - Variables File
 Assessment Year: 2026-27 (Financial Year: 2025-26)
 
 Reads values from .env file. Copy .env.example to .env and fill in your values.
-All values default to 0 if not set in environment.
+All values default to 0 if not set (or set empty) in environment.
 """
 
 import os
+from dataclasses import make_dataclass
+from typing import Iterable, List, Mapping
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 
-def get_float(key: str, default: float = 0) -> float:
-    """Get float value from environment variable."""
-    return float(os.getenv(key, default))
-
-
-def get_int(key: str, default: int = 0) -> int:
-    """Get int value from environment variable."""
-    return int(os.getenv(key, default))
-
-
-def get_bool(key: str, default: bool = False) -> bool:
-    """Get boolean value from environment variable."""
-    return os.getenv(key, str(default)).lower() in ('true', '1', 'yes')
-
-
-def get_str(key: str, default: str = "") -> str:
-    """Get string value from environment variable."""
-    return os.getenv(key, default)
-
-
 # =============================================================================
 # PERSONAL INFORMATION
 # =============================================================================
 
 # Age category: "below_60", "senior" (60-80), "super_senior" (above 80)
-age_category: str = get_str("AGE_CATEGORY", "below_60")
+age_category: str
 
 # City type for HRA calculation: "metro" (Delhi, Mumbai, Chennai, Kolkata) or "non_metro"
-city_type: str = get_str("CITY_TYPE", "non_metro")
+city_type: str
 
 # =============================================================================
 # SALARY COMPONENTS (Annual Amounts in INR)
 # =============================================================================
 
 # Basic Components
-basic_salary: float = get_float("BASIC_SALARY")
-dearness_allowance: float = get_float("DEARNESS_ALLOWANCE")  # DA
+basic_salary: float
+dearness_allowance: float  # DA
 
 # House Rent Allowance
-hra_received: float = get_float("HRA_RECEIVED")
-rent_paid_annual: float = get_float("RENT_PAID_ANNUAL")  # Actual rent paid per year
+hra_received: float
+rent_paid_annual: float  # Actual rent paid per year
 
 # Travel & Conveyance
-lta_received: float = get_float("LTA_RECEIVED")  # Leave Travel Allowance
-lta_claimed: float = get_float("LTA_CLAIMED")  # Actual travel expenses claimed
-conveyance_allowance: float = get_float("CONVEYANCE_ALLOWANCE")  # For official duties
-conveyance_actual_expenses: float = get_float("CONVEYANCE_ACTUAL_EXPENSES")
+lta_received: float  # Leave Travel Allowance
+lta_claimed: float  # Actual travel expenses claimed
+conveyance_allowance: float  # For official duties
+conveyance_actual_expenses: float
 
 # Special Allowances
-special_allowance: float = get_float("SPECIAL_ALLOWANCE")  # Fully taxable
-transport_allowance: float = get_float("TRANSPORT_ALLOWANCE")  # For commute
+special_allowance: float  # Fully taxable
+transport_allowance: float  # For commute
 
 # Reimbursements / Perquisites (Company provides these against actual expenses)
-fuel_allowance: float = get_float("FUEL_ALLOWANCE")  # Fuel/Petrol expenses
-vehicle_maintenance_allowance: float = get_float("VEHICLE_MAINTENANCE_ALLOWANCE")  # Vehicle repair
-books_periodicals_allowance: float = get_float("BOOKS_PERIODICALS_ALLOWANCE")  # Books & periodicals
-mobile_telephone_allowance: float = get_float("MOBILE_TELEPHONE_ALLOWANCE")  # Mobile/phone
-broadband_allowance: float = get_float("BROADBAND_ALLOWANCE")  # Internet/broadband
-furniture_computer_allowance: float = get_float("FURNITURE_COMPUTER_ALLOWANCE")  # Furniture/computer
-other_reimbursements: float = get_float("OTHER_REIMBURSEMENTS")  # Any other reimbursements
+fuel_allowance: float  # Fuel/Petrol expenses
+vehicle_maintenance_allowance: float  # Vehicle repair
+books_periodicals_allowance: float  # Books & periodicals
+mobile_telephone_allowance: float  # Mobile/phone
+broadband_allowance: float  # Internet/broadband
+furniture_computer_allowance: float  # Furniture/computer
+other_reimbursements: float  # Any other reimbursements
 
 # For Disabled Employees (Transport Allowance)
-is_disabled: bool = get_bool("IS_DISABLED")  # If True, transport allowance exempt up to Rs 3,200/month
+is_disabled: bool  # If True, transport allowance exempt up to Rs 3,200/month
 
 # Children Related Allowances
-children_education_allowance: float = get_float("CHILDREN_EDUCATION_ALLOWANCE")  # Max exempt: Rs 100/month/child
-hostel_allowance: float = get_float("HOSTEL_ALLOWANCE")  # Max exempt: Rs 300/month/child
-number_of_children: int = get_int("NUMBER_OF_CHILDREN")  # Max 2 for exemption purposes
+children_education_allowance: float  # Max exempt: Rs 100/month/child
+hostel_allowance: float  # Max exempt: Rs 300/month/child
+number_of_children: int  # Max 2 for exemption purposes
 
 # Work Related Allowances
-helper_allowance: float = get_float("HELPER_ALLOWANCE")  # For hiring helper (Driver salary, etc.)
-helper_actual_expenses: float = get_float("HELPER_ACTUAL_EXPENSES")  # Actual amount spent
-uniform_allowance: float = get_float("UNIFORM_ALLOWANCE")  # For uniform purchase/maintenance
-uniform_actual_expenses: float = get_float("UNIFORM_ACTUAL_EXPENSES")  # Actual amount spent
+helper_allowance: float  # For hiring helper (Driver salary, etc.)
+helper_actual_expenses: float  # Actual amount spent
+uniform_allowance: float  # For uniform purchase/maintenance
+uniform_actual_expenses: float  # Actual amount spent
 
 # Food/Meal Benefits
-meal_allowance: float = get_float("MEAL_ALLOWANCE")  # Food vouchers/Sodexo
-number_of_working_days: int = get_int("NUMBER_OF_WORKING_DAYS", 220)
+meal_allowance: float  # Food vouchers/Sodexo
+number_of_working_days: int
 
 # Performance Pay
-bonus: float = get_float("BONUS")
-commission: float = get_float("COMMISSION")
-overtime_pay: float = get_float("OVERTIME_PAY")
+bonus: float
+commission: float
+overtime_pay: float
 
 # =============================================================================
 # RETIREMENT BENEFITS (Usually received on retirement/resignation)
 # =============================================================================
 
-gratuity_received: float = get_float("GRATUITY_RECEIVED")  # Exempt up to Rs 20L (old) / Rs 5L (new)
-leave_encashment_received: float = get_float("LEAVE_ENCASHMENT_RECEIVED")  # Exempt up to Rs 25L
-is_government_employee: bool = get_bool("IS_GOVERNMENT_EMPLOYEE")
+gratuity_received: float  # Exempt up to Rs 20L (old) / Rs 5L (new)
+leave_encashment_received: float  # Exempt up to Rs 25L
+is_government_employee: bool
 
 # =============================================================================
 # EMPLOYER CONTRIBUTIONS
 # =============================================================================
 
-employer_epf_contribution: float = get_float("EMPLOYER_EPF_CONTRIBUTION")
-employer_nps_contribution: float = get_float("EMPLOYER_NPS_CONTRIBUTION")
-employer_superannuation_contribution: float = get_float("EMPLOYER_SUPERANNUATION_CONTRIBUTION")
+employer_epf_contribution: float
+employer_nps_contribution: float
+employer_superannuation_contribution: float
 
 # Note: Combined limit of Rs 7.5L for EPF + NPS + Superannuation. Excess is taxable.
 
@@ -120,106 +102,178 @@ employer_superannuation_contribution: float = get_float("EMPLOYER_SUPERANNUATION
 # =============================================================================
 
 # Standard Deduction: Auto-calculated (Rs 50,000 old / Rs 75,000 new)
-professional_tax_paid: float = get_float("PROFESSIONAL_TAX_PAID")  # Max Rs 2,500
-entertainment_allowance: float = get_float("ENTERTAINMENT_ALLOWANCE")  # Only for Govt employees
+professional_tax_paid: float  # Max Rs 2,500
+entertainment_allowance: float  # Only for Govt employees
 
 # =============================================================================
 # SECTION 10 - EXEMPTIONS
 # =============================================================================
 
-other_section_10_exemptions: float = get_float("OTHER_SECTION_10_EXEMPTIONS")
+other_section_10_exemptions: float
 
 # =============================================================================
 # CHAPTER VI-A DEDUCTIONS (OLD REGIME ONLY, except 80CCD(2))
 # =============================================================================
 
 # Section 80C (Combined limit Rs 1,50,000)
-epf_contribution_employee: float = get_float("EPF_CONTRIBUTION_EMPLOYEE")
-ppf_contribution: float = get_float("PPF_CONTRIBUTION")
-life_insurance_premium: float = get_float("LIFE_INSURANCE_PREMIUM")
-elss_investment: float = get_float("ELSS_INVESTMENT")
-nsc_investment: float = get_float("NSC_INVESTMENT")
-sukanya_samriddhi: float = get_float("SUKANYA_SAMRIDDHI")
-tax_saver_fd: float = get_float("TAX_SAVER_FD")
-tuition_fees: float = get_float("TUITION_FEES")
-home_loan_principal: float = get_float("HOME_LOAN_PRINCIPAL")
-scss_investment: float = get_float("SCSS_INVESTMENT")
-other_80c: float = get_float("OTHER_80C")
+epf_contribution_employee: float
+ppf_contribution: float
+life_insurance_premium: float
+elss_investment: float
+nsc_investment: float
+sukanya_samriddhi: float
+tax_saver_fd: float
+tuition_fees: float
+home_loan_principal: float
+scss_investment: float
+other_80c: float
 
 # Section 80CCC - Pension Fund (within 80C limit)
-pension_fund_contribution: float = get_float("PENSION_FUND_CONTRIBUTION")
+pension_fund_contribution: float
 
 # Section 80CCD(1) - Employee NPS Contribution (within 80C limit)
-employee_nps_contribution: float = get_float("EMPLOYEE_NPS_CONTRIBUTION")
+employee_nps_contribution: float
 
 # Section 80CCD(1B) - Additional NPS (Over and above 80C, max Rs 50,000)
-additional_nps_contribution: float = get_float("ADDITIONAL_NPS_CONTRIBUTION")
+additional_nps_contribution: float
 
 # Section 80CCD(2) - Employer NPS (ALLOWED IN BOTH REGIMES, up to 14% of basic+DA)
 # This is auto-calculated from employer_nps_contribution
 
 # Section 80D - Health Insurance Premium
-health_insurance_self: float = get_float("HEALTH_INSURANCE_SELF")  # Max Rs 25,000 / Rs 50,000 if senior
-health_insurance_parents: float = get_float("HEALTH_INSURANCE_PARENTS")  # Max Rs 25,000 / Rs 50,000
-preventive_health_checkup: float = get_float("PREVENTIVE_HEALTH_CHECKUP")  # Max Rs 5,000
-parents_are_senior_citizen: bool = get_bool("PARENTS_ARE_SENIOR_CITIZEN")
+health_insurance_self: float  # Max Rs 25,000 / Rs 50,000 if senior
+health_insurance_parents: float  # Max Rs 25,000 / Rs 50,000
+preventive_health_checkup: float  # Max Rs 5,000
+parents_are_senior_citizen: bool
 
 # Section 80DD - Disabled Dependent
-disabled_dependent_expenses: float = get_float("DISABLED_DEPENDENT_EXPENSES")  # Rs 75,000 / Rs 1,25,000
-is_severe_disability: bool = get_bool("IS_SEVERE_DISABILITY")
+disabled_dependent_expenses: float  # Rs 75,000 / Rs 1,25,000
+is_severe_disability: bool
 
 # Section 80DDB - Medical Treatment for Specified Diseases
-medical_treatment_expenses: float = get_float("MEDICAL_TREATMENT_EXPENSES")  # Rs 40,000 / Rs 1,00,000
+medical_treatment_expenses: float  # Rs 40,000 / Rs 1,00,000
 
 # Section 80E - Education Loan Interest (No upper limit, max 8 years)
-education_loan_interest: float = get_float("EDUCATION_LOAN_INTEREST")
+education_loan_interest: float
 
 # Section 80EE - Home Loan Interest (First-time buyers)
-home_loan_interest_80ee: float = get_float("HOME_LOAN_INTEREST_80EE")  # Max Rs 50,000
+home_loan_interest_80ee: float  # Max Rs 50,000
 
 # Section 80EEA - Additional Home Loan Interest (Affordable housing)
-home_loan_interest_80eea: float = get_float("HOME_LOAN_INTEREST_80EEA")  # Max Rs 1,50,000
+home_loan_interest_80eea: float  # Max Rs 1,50,000
 
 # Section 80EEB - Electric Vehicle Loan Interest
-ev_loan_interest: float = get_float("EV_LOAN_INTEREST")  # Max Rs 1,50,000
+ev_loan_interest: float  # Max Rs 1,50,000
 
 # Section 80G - Donations
-donations_100_percent: float = get_float("DONATIONS_100_PERCENT")  # PM Relief Fund, etc.
-donations_50_percent: float = get_float("DONATIONS_50_PERCENT")  # Other approved funds
+donations_100_percent: float  # PM Relief Fund, etc.
+donations_50_percent: float  # Other approved funds
 
 # Section 80GG - Rent Paid (If NOT receiving HRA)
-rent_paid_no_hra: float = get_float("RENT_PAID_NO_HRA")  # Max Rs 60,000/year
+rent_paid_no_hra: float  # Max Rs 60,000/year
 
 # Section 80TTA - Interest on Savings Account (Non-Senior Citizens)
-savings_account_interest: float = get_float("SAVINGS_ACCOUNT_INTEREST")  # Max Rs 10,000
+savings_account_interest: float  # Max Rs 10,000
 
 # Section 80TTB - Interest Income for Senior Citizens
-senior_citizen_interest_income: float = get_float("SENIOR_CITIZEN_INTEREST_INCOME")  # Max Rs 50,000
+senior_citizen_interest_income: float  # Max Rs 50,000
 
 # Section 80U - Person with Disability (Self)
-self_disability_claim: bool = get_bool("SELF_DISABILITY_CLAIM")
-self_severe_disability: bool = get_bool("SELF_SEVERE_DISABILITY")
+self_disability_claim: bool
+self_severe_disability: bool
 
 # =============================================================================
 # SECTION 24 - HOME LOAN INTEREST DEDUCTION
 # =============================================================================
 
-home_loan_interest_self_occupied: float = get_float("HOME_LOAN_INTEREST_SELF_OCCUPIED")  # Max Rs 2,00,000
-home_loan_interest_let_out: float = get_float("HOME_LOAN_INTEREST_LET_OUT")  # No limit
-rental_income_annual: float = get_float("RENTAL_INCOME_ANNUAL")
-pre_construction_interest: float = get_float("PRE_CONSTRUCTION_INTEREST")
-construction_completed: bool = get_bool("CONSTRUCTION_COMPLETED")
+home_loan_interest_self_occupied: float  # Max Rs 2,00,000
+home_loan_interest_let_out: float  # No limit
+rental_income_annual: float
+pre_construction_interest: float
+construction_completed: bool
 
 # =============================================================================
 # OTHER INCOME
 # =============================================================================
 
-interest_income_other: float = get_float("INTEREST_INCOME_OTHER")  # FD interest, etc.
-other_income: float = get_float("OTHER_INCOME")
+interest_income_other: float  # FD interest, etc.
+other_income: float
 
 # =============================================================================
 # TAX ALREADY PAID
 # =============================================================================
 
-tds_deducted: float = get_float("TDS_DEDUCTED")
-advance_tax_paid: float = get_float("ADVANCE_TAX_PAID")
+tds_deducted: float
+advance_tax_paid: float
+
+# =============================================================================
+# LOAD FROM ENVIRONMENT
+# =============================================================================
+
+# Defaults for variables that do not default to 0 / False
+_DEFAULTS = {
+    'age_category': 'below_60',
+    'city_type': 'non_metro',
+    'number_of_working_days': 220,
+}
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value."""
+    return value.lower() in ('true', '1', 'yes')
+
+
+# Parser for each annotated type
+_PARSERS = {float: float, int: int, bool: _parse_bool, str: str}
+
+# (variable name, environment key, parser, default) for every variable above
+_SCHEMA = [
+    (name, name.upper(), _PARSERS[kind], _DEFAULTS.get(name, kind()))
+    for name, kind in __annotations__.items()
+]
+
+
+def _load(environ) -> dict:
+    """Parse every schema variable from an environment mapping."""
+    # One snapshot, so each lookup is a plain dict get rather than a
+    # key encode/value decode through os.environ; empty values use the default
+    env = dict(environ)
+    values = {}
+    for name, key, parse, default in _SCHEMA:
+        raw = env.get(key)
+        values[name] = parse(raw) if raw else default
+    return values
+
+
+globals().update(_load(os.environ))
+
+# All inputs as one immutable record, e.g. for cached or batch calculations
+TaxInputs = make_dataclass(
+    'TaxInputs',
+    [(name, kind) for name, kind in __annotations__.items()],
+    slots=True,
+    frozen=True,
+    module=__name__,
+)
+
+
+def current_inputs() -> TaxInputs:
+    """Snapshot the current module-level values as a TaxInputs record."""
+    values = globals()
+    return TaxInputs(*[values[name] for name, _, _, _ in _SCHEMA])
+
+
+# Environment keys accepted as columns by load_inputs
+_ENV_KEYS = frozenset(key for _, key, _, _ in _SCHEMA)
+
+
+def load_inputs(rows: Iterable[Mapping[str, str]]) -> List[TaxInputs]:
+    """Parse one TaxInputs per row keyed like the .env file (e.g. BASIC_SALARY), such
+    as a csv.DictReader; compare_regimes_batch takes variable names instead."""
+    records = []
+    for row in rows:
+        unknown = row.keys() - _ENV_KEYS
+        if unknown:
+            raise ValueError(f"Unknown inputs: {', '.join(sorted(map(str, unknown)))}")
+        records.append(TaxInputs(**_load(row)))
+    return records